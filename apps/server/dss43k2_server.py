@@ -122,6 +122,7 @@ class DSS43K2Server(Pyro4Server):
                                     create_tunnel_kwargs=None,
                                     remote_username=remote_username)
         self.logger.info("__init__: self.logger.level: {}".format(self.logger.level))
+        self._log_debug = self.logger.isEnabledFor(logging.DEBUG)
         self.internal_server_thread = None
 
         self.subscriber_ns_host = ns_host
@@ -180,6 +181,9 @@ class DSS43K2Server(Pyro4Server):
         cdscc.epoch = ephem.J2000
         cdscc.date = datetime.datetime.utcnow()
         self._cdscc = cdscc
+        # observatory location doesn't change, so convert it to degrees once
+        self._lat_deg = np.rad2deg(float(cdscc.lat))
+        self._lon_deg = np.rad2deg(float(cdscc.lon))
 
         self.logger.debug("Current data directory: {}".format(self._data_dir))
             # self._data_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # default file path.
@@ -192,6 +196,8 @@ class DSS43K2Server(Pyro4Server):
         self.pm_recording_worker = None
         self.apc_recording_worker = None
         self.rms_recording_worker = None
+        self._rms_worker_logger = logging.getLogger(self.logger.name + ".RMSWorker")
+        self._rms_worker_logger.setLevel(logging.INFO)
         self.apc_info = {}
         self.tsys_info = {}
         self.rms_info = {}
@@ -1974,11 +1980,9 @@ class DSS43K2Server(Pyro4Server):
             self.rms_recording_worker.stop()
             self.rms_recording_worker = None
         self.logger.debug("worker_cb_info: {}".format(worker_cb_info))
-        logger = logging.getLogger(self.logger.name + ".RMSWorker")
-        logger.setLevel(logging.INFO)
 
         self.rms_recording_worker = RMSWorker(self, self.spec, update_rate,
-                                    logger=logger, cb_info=worker_cb_info, socket_info=self.start_rms_publishing.socket_info)
+                                    logger=self._rms_worker_logger, cb_info=worker_cb_info, socket_info=self.start_rms_publishing.socket_info)
         # self.rms_recording_worker._async.async_method = True
         self.rms_recording_worker.start()
         self.start_rms_publishing.cb()
@@ -2005,7 +2009,8 @@ class DSS43K2Server(Pyro4Server):
     @async.async_method
     def get_current_accum_all(self):
         """Get the current accumulations for all the ROACHs"""
-        self.logger.debug("get_current_accum_all: Called.")
+        if self._log_debug:
+            self.logger.debug("get_current_accum_all: Called.")
         spectra = [self.spec.get_cur_accum(i) for i in xrange(1,5)]
         self.get_current_accum_all.cb({"success":True, "spectra":spectra})
 
@@ -2013,7 +2018,8 @@ class DSS43K2Server(Pyro4Server):
     @async.async_method
     def get_current_accum(self, i):
         """Get the current accumulation in a specific ROACH"""
-        self.logger.debug("get_current_accum: Called.")
+        if self._log_debug:
+            self.logger.debug("get_current_accum: Called.")
         spectrum = self.spec.get_cur_accum(i)
         self.get_current_accum.cb({"success":True, "spectrum":[i,spectrum]})
 
@@ -2402,8 +2408,7 @@ class DSS43K2Server(Pyro4Server):
 
         This uses the OpenWeatherMap API to get weather data.
         """
-        weather_req = weather.get_current_weather(np.rad2deg(float(self._cdscc.lat)),
-                                                  np.rad2deg(float(self._cdscc.lon)))
+        weather_req = weather.get_current_weather(self._lat_deg, self._lon_deg)
         if weather_req.status_code != 200:
             return {"success": False}
         else:
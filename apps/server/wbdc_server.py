@@ -1,22 +1,41 @@
 # wbdc_server.py
-from __future__ import print_function
 import logging
+import ast
 import time
 import functools
 import json
 import random
 import datetime
 import os
+import threading
+import itertools
+import importlib
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 import Pyro4
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from support.threading_util import PausableThread, iterativeRun
 from support.pyro import Pyro4Server, get_device_server, config
 from support.test import auto_test
 from MonitorControl.Configurations.CDSCC import FO_patching
 
+# "async" is a keyword on Python 3.7+, so support.pyro.async can't be imported by name.
+pyro_async = importlib.import_module("support.pyro.async")
+
 Pyro4.config.COMMTIMEOUT = 0.0
 
+# Python 2 has neither time.monotonic nor os.replace. os.rename also
+# replaces an existing file on POSIX systems.
+_monotonic = getattr(time, "monotonic", time.time)
+_replace_file = getattr(os, "replace", os.rename)
+
 module_logger = logging.getLogger()
 
 class WBDCFEPublisherThread(PausableThread):
@@ -29,15 +48,54 @@ class WBDCFEPublisherThread(PausableThread):
 
         self.wbdc_fe_server = wbdc_fe_server
         self.bus = bus
+        if self.bus:
+            # Readings are sent on the bus from a separate thread, so the next
+            # get_tsys call doesn't wait for the previous send.
+            self._send_queue = queue.Queue(maxsize=2)
+            self._sender_thread = threading.Thread(target=self._send_readings,
+                                                   name=thread_name + "Sender")
+            self._sender_thread.daemon = True
+            self._sender_thread.start()
+
+    def _send_readings(self):
+        """
+        Send queued readings on the bus, until self.stop puts None on the queue.
+        """
+        while True:
+            readings = self._send_queue.get()
+            # run may have dropped the None as an old reading, so check stopped() too
+            if readings is None or self.stopped():
+                return
+            try:
+                self.bus.send('power_meter', readings)
+            except Exception as err:
+                module_logger.error("WBDCFEPublisherThread: couldn't send readings: {}".format(err))
 
     @iterativeRun
     def run(self):
         readings = self.wbdc_fe_server.get_tsys()
         if self.bus:
-            self.bus.send('power_meter', readings)
-
-        with self.wbdc_fe_server._lock:
-            self.wbdc_fe_server.pm_readings = readings
+            # if the sender has fallen behind, drop the oldest readings rather than wait
+            while True:
+                try:
+                    self._send_queue.put_nowait(readings)
+                    break
+                except queue.Full:
+                    try:
+                        self._send_queue.get_nowait()
+                        module_logger.debug("WBDCFEPublisherThread: sender has fallen behind; dropped the oldest readings")
+                    except queue.Empty:
+                        pass
+        # a single attribute rebind is atomic, so no lock is needed here
+        self.wbdc_fe_server.pm_readings = readings
+
+    def stop(self):
+        """
+        Reimplemented from PausableThread, to stop the sender thread as well.
+        """
+        PausableThread.stop(self)
+        if self.bus:
+            self._send_queue.put(None)
 
 
 class ParserDecorator(object):
@@ -59,6 +117,10 @@ class ParserDecorator(object):
         self.str_corr = str_correspondance
         self.opt_corr = opt_correspondance
         self.mode = mode
+        # normalized string -> (opt, canonical string), so each call needs a single lookup
+        self._table = {s.lower().strip(): (opt, s) for s, opt in zip(self.str_corr, self.opt_corr)}
+        self._bool_table = {True: (self.opt_corr[0], self.str_corr[0]),
+                            False: (self.opt_corr[1], self.str_corr[1])}
         self.annotation_obj = auto_test(args=(self.str_corr[0], ), returns=returns)
 
     def __call__(self, f):
@@ -68,21 +130,13 @@ class ParserDecorator(object):
         @functools.wraps(func)
         def wrapper(obj, state):
             try:
-                if isinstance(state, str):
-                    if state.lower().strip() not in self.str_corr:
+                if isinstance(state, bool):
+                    opt, state = self._bool_table[state]
+                else:
+                    try:
+                        opt, state = self._table[state.lower().strip()]
+                    except KeyError:
                         raise ValueError("Argument {} not recognized".format(state))
-                elif isinstance(state, bool):
-                    if state:
-                        state = self.str_corr[0]
-                    else:
-                        state = self.str_corr[1]
-
-                if state.lower().strip() == self.str_corr[0]:
-                    opt = self.opt_corr[0]
-                    state = self.str_corr[0]
-                elif state.lower().strip() == self.str_corr[1]:
-                    opt = self.opt_corr[1]
-                    state = self.str_corr[1]
 
                 if self.mode:
                     setattr(obj, self.mode, state)
@@ -117,6 +171,223 @@ def error_decorator(fn):
 
     return wrapper
 
+# _set_WBDC option -> (hardware server attribute, whether errors are caught and logged)
+# See WBDCFrontEndServer._set_WBDC for what each option does.
+_set_WBDC_targets = {}
+_set_WBDC_targets.update((opt, ('FE', True)) for opt in
+                         itertools.chain(range(12, 17), range(20, 30), range(31, 37)))
+_set_WBDC_targets.update((opt, ('FE', False)) for opt in
+                         itertools.chain([18], range(391, 395), range(401, 405)))
+_set_WBDC_targets.update((opt, ('wbdc', False)) for opt in
+                         itertools.chain([38], range(41, 53)))
+
+def ttl_cache(key, ttl):
+    """
+    Decorator that caches the result of a getter for ttl seconds.
+    Set up to work with method calls that take no arguments, on objects that
+    have _ttl_cache, _ttl_cache_lock and _ttl_cache_generation attributes.
+    Setters that change the corresponding hardware state should be decorated
+    with invalidates(key) so we never return stale values. A result is not
+    cached if the cache was invalidated while the getter ran, as it may
+    predate the change.
+    Args:
+        key (str): The name under which the result is cached
+        ttl (float): How long, in seconds, the result stays valid
+    Returns:
+        function: the decorator
+    """
+    def decorator(fn):
+
+        @functools.wraps(fn)
+        def wrapper(obj):
+            now = _monotonic()
+            with obj._ttl_cache_lock:
+                entry = obj._ttl_cache.get(key)
+                generation = obj._ttl_cache_generation
+            if entry is not None and now < entry[0]:
+                return entry[1]
+            value = fn(obj)
+            with obj._ttl_cache_lock:
+                if obj._ttl_cache_generation == generation:
+                    obj._ttl_cache[key] = (now + ttl, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+def invalidates(*keys):
+    """
+    Decorator for setters that change hardware state cached by ttl_cache.
+    The keys are dropped before the setter runs, and again once it returns,
+    so a getter that read the old state during the write can't leave it cached.
+    Set up to work with method calls, on objects with an _invalidate_cache method.
+    Args:
+        *keys (str): the ttl_cache keys to drop
+    Returns:
+        function: the decorator
+    """
+    def decorator(fn):
+
+        @functools.wraps(fn)
+        def wrapper(obj, *args, **kwargs):
+            obj._invalidate_cache(*keys)
+            try:
+                return fn(obj, *args, **kwargs)
+            finally:
+                obj._invalidate_cache(*keys)
+
+        return wrapper
+
+    return decorator
+
+def _json_loads(data):
+    """
+    Parse JSON, using orjson if it is available.
+    Args:
+        data (bytes): JSON document
+    Returns:
+        the parsed document
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _json_dumps(obj):
+    """
+    Serialize to compact JSON, using orjson if it is available.
+    orjson refuses some types the json module accepts (eg numpy scalars),
+    in which case we fall back to the json module.
+    Args:
+        obj: object to serialize
+    Returns:
+        bytes: JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode("utf-8")
+
+def _uniform_value(states):
+    """
+    Check whether all the switch states reported by the WBDC are the same.
+    Args:
+        states (dict, list): states, keyed by switch name if a dict
+    Returns:
+        the common state, or None if the states differ or there are none
+    """
+    if isinstance(states, dict):
+        states = list(states.values())
+    if states and states.count(states[0]) == len(states):
+        return states[0]
+    return None
+
+def _tsysfactor_property(i):
+    """
+    Create a property that exposes one element of the tsys factors list as
+    tsysfactor1, tsysfactor2, etc.
+    Args:
+        i (int): index into WBDCFrontEndServer._tsysfactors
+    Returns:
+        property
+    """
+    def fget(obj):
+        return obj._tsysfactors[i]
+
+    def fset(obj, value):
+        obj._tsysfactors[i] = value
+
+    return property(fget, fset, doc="tsys factor for power meter {}".format(i+1))
+
+class SerializedProxy(object):
+    """
+    A single proxy to one hardware server, shared by all threads.
+
+    A proxy can't be used by several threads at once, and the hardware servers
+    aren't known to be thread safe, so calls through the proxy are made one at
+    a time. Attribute access returns a function that does this, so a
+    SerializedProxy can stand in for the proxy itself.
+    """
+    def __init__(self, proxy):
+        """
+        Args:
+            proxy: the proxy to the hardware server
+        """
+        self._proxy = proxy
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return getattr(self._proxy, name)(*args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+class _Call(threading.Thread):
+    """
+    Call a function in its own thread.
+    """
+    def __init__(self, fn):
+        """
+        Args:
+            fn (callable): the function to call, with no arguments
+        """
+        threading.Thread.__init__(self, name="Call-" + getattr(fn, "__name__", "fn"))
+        self.daemon = True
+        self._fn = fn
+        self._value = None
+        self._error = None
+
+    def run(self):
+        try:
+            self._value = self._fn()
+        except Exception as err:
+            self._error = err
+
+    def result(self):
+        """
+        Wait for the call to finish.
+        Returns:
+            whatever the function returned. If it raised, the exception is raised here.
+        """
+        self.join()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+def _call_concurrently(fns):
+    """
+    Call several functions at once, each in its own thread.
+    Args:
+        fns (dict): functions that take no arguments, keyed by any name
+    Returns:
+        dict: _Call objects with the same keys. Their result method returns
+            what the function returned.
+    """
+    calls = {key: _Call(fn) for key, fn in fns.items()}
+    for call in calls.values():
+        call.start()
+    return calls
+
+# keys of the dicts returned by the simulator
+_front_end_temp_keys = ('load1', 'load2', '12K', '70K')
+_analog_data_keys = ('+12 V', '+16 V', '+16 V LDROs', '+16 V MB', '+16 V R1 BE', '+16 V R1 FE',
+                     '+16 V R2 BE', '+16 V R2 FE', '+6 V R1 FE', '+6 V R2 FE', '+6 V ana',
+                     '+6 V analog MB', '+6 V dig', '+6 V digitalMB', '-16 V', '-16 V MB',
+                     '-16 V R1 BE', '-16 V R1 FE', '-16 V R2 BE', '-16 V R2 FE', 'BE plate',
+                     'R1 E-plane', 'R1 H-plane', 'R1 RF plate', 'R2 E-plane', 'R2 H-plane',
+                     'R2 RF plate')
+_polarizer_keys = tuple("R{}-{}".format(r, band) for r in (1, 2) for band in (18, 20, 22, 24, 26))
+# (band, receiver 1 key, receiver 2 key) for the polarizer summary in get_WBDCFrontEnd_state
+_report_polarizer_keys = tuple((band, "R1-" + band, "R2-" + band) for band in ('22', '20', '18', '24', '26'))
+_IF_hybrid_keys = tuple("{}P{}".format(key, p) for key in _polarizer_keys for p in (1, 2))
+
 wbdc_settings_file = os.path.join(
                 os.path.dirname(os.path.abspath(__file__)), "WBDCFrontEndsettings.json"
 )
@@ -139,6 +410,12 @@ class WBDCFrontEndServer(Pyro4Server):
         if logger is None: logger = logging.getLogger(__name__+".WBDCFrontEndServer")
         self._simulated = simulated
         super(WBDCFrontEndServer, self).__init__(obj=self,name=name, logfile=logfile, logger=logger)
+        # short lived cache of hardware state, see ttl_cache.
+        # The 'minical' entry is (time the minical started, results) instead; see perform_minical.
+        self._ttl_cache = {}
+        self._ttl_cache_lock = threading.RLock()
+        # incremented by every invalidation, see ttl_cache
+        self._ttl_cache_generation = 0
         if not patching_file_path:
             self._dist_assmbly = FO_patching.DistributionAssembly()
         else:
@@ -153,10 +430,9 @@ class WBDCFrontEndServer(Pyro4Server):
         if settings_file is None: settings_file = wbdc_settings_file
         self.settings_file = settings_file
         # Set the distribution assembly
-        self._pm_patching_inputs = self.get_pm_patching_sources()
-        self.logger.debug(self._pm_patching_inputs)
-        self._pm_att = self.get_pm_atten_names(self._pm_patching_inputs)
-        self.logger.debug(self._pm_att)
+        self._pm_patching_inputs = None
+        self._pm_att = None
+        self.invalidate_patching_cache()
 
         # Set the internal Power Meter states.
         # These values get updated if we call corresponding get/set methods
@@ -165,30 +441,46 @@ class WBDCFrontEndServer(Pyro4Server):
         self._IF_hybrid_mode = 'iq'
 
         # initialize tsysfactor* attributes
-        self.tsysfactor1 = 1.0
-        self.tsysfactor2 = 1.0
-        self.tsysfactor3 = 1.0
-        self.tsysfactor4 = 1.0
+        self._tsysfactors = [1.0, 1.0, 1.0, 1.0]
 
         # We don't call self.get_WBDCFrontEnd_state at instantiation
         # because it takes half a century to run (on the order of twenty seconds)
         self.WBDCFrontEnd_summary = None
         if not os.path.isfile(self.settings_file):
             open(self.settings_file, 'w').close() # make sure file exists
+        # in-memory copy of the settings file, so we don't re-read it on every save
+        self._settings_json_cache = self._read_settings()
+        # saves are queued and written by a background thread, so callers don't wait on the disk
+        self._save_queue = queue.Queue()
+        self._settings_writer_thread = threading.Thread(target=self._settings_writer,
+                                                        name="SettingsWriter")
+        self._settings_writer_thread.daemon = True
+        self._settings_writer_thread.start()
 
         # attempt to get old minical calibration data. (This updates the tsys values)
         self.retrieve_previous_minical_results()
 
-        # Set the 'modes' of the WBDC:
-        self._modes = ['A2LiP1I', 'A2LiP1Q', 'A2LiP2I', 'A2LiP2Q',
-                      'A2LiP1L', 'A2LiP1U', 'A2LiP2L', 'A2LiP2U',
-                      'A2CiP1I', 'A2CiP1Q', 'A2CiP2I', 'A2CiP2Q',
-                      'A2CiP1L', 'A2CiP1U', 'A2CiP2L', 'A2CiP2U',
-                      'A1LiP1I', 'A1LiP1Q', 'A1LiP2I', 'A1LiP2Q',
-                      'A1LiP1L', 'A1LiP1U', 'A1LiP2L', 'A1LiP2U',
-                      'A1CiP1I', 'A1CiP1Q', 'A1CiP2I', 'A1CiP2Q',
-                      'A1CiP1L', 'A1CiP1U', 'A1CiP2L', 'A1CiP2U',
-                      'A1Load', 'A2Load']
+    # The 'modes' of the WBDC. These are the same for every instance.
+    _modes = ('A2LiP1I', 'A2LiP1Q', 'A2LiP2I', 'A2LiP2Q',
+              'A2LiP1L', 'A2LiP1U', 'A2LiP2L', 'A2LiP2U',
+              'A2CiP1I', 'A2CiP1Q', 'A2CiP2I', 'A2CiP2Q',
+              'A2CiP1L', 'A2CiP1U', 'A2CiP2L', 'A2CiP2U',
+              'A1LiP1I', 'A1LiP1Q', 'A1LiP2I', 'A1LiP2Q',
+              'A1LiP1L', 'A1LiP1U', 'A1LiP2L', 'A1LiP2U',
+              'A1CiP1I', 'A1CiP1Q', 'A1CiP2I', 'A1CiP2Q',
+              'A1CiP1L', 'A1CiP1U', 'A1CiP2L', 'A1CiP2U',
+              'A1Load', 'A2Load')
+
+    # _set_WBDC opts for the FE and WBDC switches, keyed by (feed, state) or state
+    _feed_state_opts = {(1, 'sky'): 13, (1, 'load'): 14, (2, 'sky'): 15, (2, 'load'): 16}
+    _noise_diode_opts = {True: 23, False: 24}
+    _preamp_bias_opts = {(1, True): 25, (1, False): 26, (2, True): 27, (2, False): 28}
+    _crossover_switch_opts = {True: 41, False: 42}
+
+    tsysfactor1 = _tsysfactor_property(0)
+    tsysfactor2 = _tsysfactor_property(1)
+    tsysfactor3 = _tsysfactor_property(2)
+    tsysfactor4 = _tsysfactor_property(3)
 
     @property
     def simulated(self):
@@ -200,11 +492,15 @@ class WBDCFrontEndServer(Pyro4Server):
         Returns:
             None
         """
+        # Hardware state is queried from several threads at once (see _call_concurrently),
+        # so calls to each server are serialized.
         # WBDC server
-        self.wbdc = get_device_server('wbdc2hw_server-dss43wbdc2', pyro_ns="crux")
+        self.wbdc = SerializedProxy(get_device_server('wbdc2hw_server-dss43wbdc2', pyro_ns="crux"))
         # FE server
-        self.FE = get_device_server('FE_server-krx43', pyro_ns="crux")
+        self.FE = SerializedProxy(get_device_server('FE_server-krx43', pyro_ns="crux"))
         self.logger.debug("Successfully got Pyro3 objects")
+        self._atten_names_cache = None
+        self._invalidate_cache()
         self._simulated = False
 
     def simulate(self):
@@ -229,19 +525,22 @@ class WBDCFrontEndServer(Pyro4Server):
         self.simulated_crossover_switch_state = {1: False, 2: False}
         self.simulated_noise_diode_state = False
         self.simulated_preamp_bias = {1: False, 2: False}
+        self._atten_names_cache = None
+        self._invalidate_cache()
         self._simulated = True
 
-    def get_tsys_factors(self):
+    def _invalidate_cache(self, *keys):
         """
-        Get the tsys factors that allow for conversion between raw power meter output
-        and sky temperature
-        Returns:
-            dict: Keys are power meter names ('PM1', etc), values are tsys factors
+        Drop cached hardware state.
+        Args:
+            *keys (str): the ttl_cache keys to drop. If none are given, drop everything.
         """
-        return {'PM1': self.tsysfactor1,
-                'PM2': self.tsysfactor2,
-                'PM3': self.tsysfactor3,
-                'PM4': self.tsysfactor4}
+        with self._ttl_cache_lock:
+            self._ttl_cache_generation += 1
+            if not keys:
+                self._ttl_cache.clear()
+            for key in keys:
+                self._ttl_cache.pop(key, None)
 
     @property
     def modes(self):
@@ -308,31 +607,21 @@ class WBDCFrontEndServer(Pyro4Server):
         403 - FE   - set PM3 to dB
         404 - FE   - set PM4 to dB
         """
-        self.logger.debug("_set_WBDC: called for {}".format(opt))
-        if (opt > 11 and opt < 17) or (opt > 19 and opt < 30) or (opt > 30 and opt < 37):
-            try:
-                result = self.FE.set_WBDC(opt)
-            except Exception, details:
-                self.logger.error("_set_WBDC: failed because {}".format(details))
-                result = "False"
-            self.logger.debug("_set_WBDC: returned {}".format(result))
-            return result
-        elif opt == 18:
-            # raise RuntimeError("Can't calculate Y-factor right now.")
-            # Yfactors, text = FElj.Y_factors(self.pm)
-            text = self.FE.set_WBDC(opt)
-            # text = ("Y-factors at " + time.ctime(time.time()) + "\n") + (str(4 * [0.0]) + "\n")
-            return text
-        elif opt == 38:
-            return self.wbdc.set_WBDC(opt)
-        elif opt > 390 and opt < 395:
-            return self.FE.set_WBDC(opt)
-        elif opt > 400 and opt < 405:
-            return self.FE.set_WBDC(opt)
-        elif opt > 40 and opt < 53:
-            return self.wbdc.set_WBDC(opt)
-        else:
+        self.logger.debug("_set_WBDC: called for %s", opt)
+        try:
+            server_name, catch_errors = _set_WBDC_targets[opt]
+        except KeyError:
             return "Invalid option", opt
+        server = getattr(self, server_name)
+        if not catch_errors:
+            return server.set_WBDC(opt)
+        try:
+            result = server.set_WBDC(opt)
+        except Exception as details:
+            self.logger.error("_set_WBDC: failed because {}".format(details))
+            result = "False"
+        self.logger.debug("_set_WBDC: returned %s", result)
+        return result
 
     def get_WBDCFrontEnd_state(self, save_config=True):
         """
@@ -343,9 +632,16 @@ class WBDCFrontEndServer(Pyro4Server):
         hybrids. (It also returns dummy values for the K1 band switch and the
         local oscillator lock.)
 
-        This function takes a long time to run (~20 seconds)
+        This function takes a long time to run (~20 seconds), so the independent
+        hardware queries are issued concurrently.
         """
         self.logger.debug("get_WBDCFrontEnd_state: called ")
+        futures = _call_concurrently({'feed_state': self.get_feed_state,
+                                      'noise_diode_state': self.get_noise_diode_state,
+                                      'cross_switch_state': self.get_crossover_switch,
+                                      'polarizer_state': self.get_polarizers,
+                                      'IF_hybrid_state': self.get_IF_hybrids,
+                                      'attens': self.get_attens})
         report = []
         report_dict = {}
         # time
@@ -355,10 +651,10 @@ class WBDCFrontEndServer(Pyro4Server):
 
         # load/sky state
         try:
-            load_state = self.get_feed_state()
+            load_state = futures['feed_state'].result()
             report.append(load_state)
             report_dict['feed_state'] = load_state
-        except Exception, details:
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting load state failed because {}".format(details))
             report.append("Feed 1 on sky\nFeed 2 on sky\n")
             report_dict['feed_state'] = None
@@ -367,32 +663,30 @@ class WBDCFrontEndServer(Pyro4Server):
 
         # noise diode
         try:
-            noise_diode_state = self.get_noise_diode_state()
+            noise_diode_state = futures['noise_diode_state'].result()
             report_dict['noise_diode_state'] = noise_diode_state
-        except Exception, details:
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting noise diode state failed: {}".format(details))
             report_dict['noise_diode_state'] = None
 
         # cross-switch state
         try:
-            cross_switch_state = self.get_crossover_switch()
+            # copied, as the simulator returns its own state dict
+            cross_switch_state = dict(futures['cross_switch_state'].result())
             report.append(cross_switch_state)
             report_dict['cross_switch_state'] = cross_switch_state
-        except Exception, details:
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting cross switch failed because {}".format(details))
             report_dict['cross_switch_state'] = None
         # polarization state
         try:
-            polstates = self.get_polarizers()
+            polstates = futures['polarizer_state'].result()
             self.logger.debug("report_WBDC: polarization states: %s", str(polstates))
-            pol_states_dict = {'22': [polstates["R1-22"], polstates["R2-22"]],
-                               '20': [polstates["R1-20"], polstates["R2-20"]],
-                               '18': [polstates["R1-18"], polstates["R2-18"]],
-                               '24': [polstates["R1-24"], polstates["R2-24"]],
-                               '26': [polstates["R1-26"], polstates["R2-26"]]}
+            pol_states_dict = {band: [polstates[r1_key], polstates[r2_key]]
+                               for band, r1_key, r2_key in _report_polarizer_keys}
             report.append(pol_states_dict)
-            report_dict['polarizer_state'] = polstates
-        except Exception, details:
+            report_dict['polarizer_state'] = dict(polstates)
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting pol_sec failed because {}".format(details))
             report_dict['polarizer_state'] = None
         # band
@@ -400,55 +694,155 @@ class WBDCFrontEndServer(Pyro4Server):
             band_state = 24
             report.append(band_state)
             report_dict['band_state'] = band_state
-        except Exception, details:
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting LO freq. failed because {}".format(details))
             report_dict['band_state'] = None
         # LO lock
         try:
-            lo_lock_state = [True for i in xrange(5)]
+            lo_lock_state = [True for i in range(5)]
             report.append(lo_lock_state)
             report_dict['lo_lock_state'] = lo_lock_state
-        except Exception, details:
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting PLOs failed because {}".format(details))
             report_dict['lo_lock_state'] = None
 
         # IF hybrids state
         try:
-            DCstates = self.get_IF_hybrids()
+            DCstates = futures['IF_hybrid_state'].result()
             self.logger.debug("get_WBDCFrontEnd_state: DC states: %s", DCstates)
             dc_states_dict = {0: {0: DCstates['R1-22P1'], 1: DCstates['R1-22P2']},
                               1: {0: DCstates['R2-22P1'], 1: DCstates['R2-22P2']}}
             report.append(dc_states_dict)
-            report_dict['IF_hybrid_state'] = DCstates
-        except Exception, details:
+            report_dict['IF_hybrid_state'] = dict(DCstates)
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting IF hybrid state failed because {}".format(details))
             report_dict['IF_hybrid_state'] = None
         # Attenuator state
         try:
-            attens = self.get_attens()
-            report_dict['attens'] = attens.copy()
-        except Exception, details:
+            attens = futures['attens'].result()
+            # the simulator's [value, 'dB'] lists change when an attenuator is set, so copy them too
+            report_dict['attens'] = {name: list(val) for name, val in attens.items()}
+        except Exception as details:
             self.logger.error("get_WBDCFrontEnd_state: getting attenuations failed: {}".format(details))
             report_dict['attens'] = None
 
         self.logger.debug("get_WBDCFrontEnd_state:\n %s", str(report))
-        self.WBDCFrontEnd_summary = report_dict.copy()
+        # report_dict is built fresh on every call, shares nothing with the hardware
+        # state, and isn't modified afterwards, so it can be shared
+        self.WBDCFrontEnd_summary = report_dict
         if save_config:
-            self.logger.debug("Saving current configuration to file {}".format(self.settings_file))
-            with open(self.settings_file, 'r+') as f:
-                try:
-                    data = json.load(f)
-                    data.update({'settings': report_dict})
-                    f.seek(0)
-                    json.dump(data, f)
-                    f.truncate()
-                except ValueError:
-                    f.seek(0)
-                    json.dump({'settings': report_dict}, f)
-                    f.truncate()
+            previous = self._settings_json_cache.get('settings')
+            if previous and all(previous.get(key) == report_dict[key]
+                                for key in report_dict if key != 'time'):
+                self.logger.debug("Configuration unchanged; not saving to file {}".format(self.settings_file))
+            else:
+                self.logger.debug("Saving current configuration to file {}".format(self.settings_file))
+                self._save_queue.put(('settings', report_dict))
 
         return report, report_dict
 
+    def get_status_bundle(self):
+        """
+        Get the analog data, front end temperatures, noise diode state, crossover
+        switch, polarizer and IF hybrid states in one call. The hardware queries
+        are independent, so they are issued concurrently.
+        Returns:
+            dict: keys are the getter names without the "get_" prefix. A value is
+                None if the corresponding getter failed.
+        """
+        futures = _call_concurrently({'analog_data': self.get_analog_data,
+                                      'front_end_temp': self.get_front_end_temp,
+                                      'noise_diode_state': self.get_noise_diode_state,
+                                      'crossover_switch': self.get_crossover_switch,
+                                      'polarizers': self.get_polarizers,
+                                      'IF_hybrids': self.get_IF_hybrids})
+        bundle = {}
+        for key, future in futures.items():
+            try:
+                bundle[key] = future.result()
+            except Exception as err:
+                self.logger.error("get_status_bundle: getting {} failed: {}".format(key, err))
+                bundle[key] = None
+        return bundle
+
+    @Pyro4.oneway
+    @pyro_async.async_method
+    def get_WBDCFrontEnd_state_async(self, save_config=True):
+        """
+        Get the WBDC Front End state without tying up the caller for the
+        duration of the hardware queries. The result of
+        self.get_WBDCFrontEnd_state is delivered through the callback.
+        cb:
+            dict:
+            'report': list summary of the receiver state
+            'report_dict': dict summary of the receiver state
+        """
+        try:
+            report, report_dict = self.get_WBDCFrontEnd_state(save_config=save_config)
+            self.get_WBDCFrontEnd_state_async.cb({'report': report,
+                                                  'report_dict': report_dict})
+        except Exception as err:
+            msg = "get_WBDCFrontEnd_state_async failed with error: {}".format(err)
+            self.logger.error(msg, exc_info=True)
+            self.get_WBDCFrontEnd_state_async.cb({"status": msg})
+
+    def _read_settings(self):
+        """
+        Read in the settings file.
+        Returns:
+            dict: contents of the settings file, or an empty dict if it is empty or unreadable.
+        """
+        try:
+            with open(self.settings_file, 'rb') as f:
+                return _json_loads(f.read())
+        except (IOError, ValueError) as err:
+            self.logger.debug("_read_settings: Couldn't read {}: {}".format(self.settings_file, err))
+            return {}
+
+    def _update_settings(self, key, value):
+        """
+        Update one section of the settings file. We write the in-memory copy of the
+        settings to a temporary file and rename it over the settings file, so a crash
+        mid-write can't leave a truncated settings file behind.
+        Args:
+            key (str): the section to update ('settings' or 'minical')
+            value: The new contents of the section
+        """
+        self._settings_json_cache[key] = value
+        tmp_file = self.settings_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(self._settings_json_cache))
+        _replace_file(tmp_file, self.settings_file)
+
+    def _settings_writer(self):
+        """
+        Write queued (key, value) updates to the settings file, one at a time.
+        This runs in its own daemon thread until self.close puts None on the queue.
+        """
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                self._save_queue.task_done()
+                return
+            key, value = item
+            try:
+                self._update_settings(key, value)
+            except Exception as err:
+                self.logger.error("_settings_writer: Couldn't save {} to {}: {}".format(
+                    key, self.settings_file, err), exc_info=True)
+            finally:
+                self._save_queue.task_done()
+
+    def close(self):
+        """
+        Reimplemented from Pyro4Server.
+        Write any queued settings to the settings file before shutting down.
+        """
+        if self._settings_writer_thread.is_alive():
+            self._save_queue.put(None)
+            self._settings_writer_thread.join()
+        Pyro4Server.close(self)
+
     def set_WBDCFrontEnd_state(self, config_file='default'):
         """
         Uses the internal WBDCFrontEnd_summary attribute to reset parameters.
@@ -456,37 +850,33 @@ class WBDCFrontEndServer(Pyro4Server):
             None
         """
         if self.WBDCFrontEnd_summary:
-            summary = self.WBDCFrontEnd_summary.copy()
+            summary = self.WBDCFrontEnd_summary  # only read from
         else:
             self.logger.debug("Couldn't use internal summary attribute -- using config file.")
             if config_file == 'default':
                 config_file = self.settings_file
             try:
-                with open(config_file, 'r') as f:
-                    summary = json.load(f)['settings']
-            except Exception, err:
+                with open(config_file, 'rb') as f:
+                    summary = _json_loads(f.read())['settings']
+            except Exception as err:
                 self.logger.error("Couldn't load in configuration file: {}".format(err), exc_info=True)
                 return
         # For resetting the polarizar state and IF_hybrids we assume that the dictionaries
         # resulting from the respective get methods will be the same.
 
         # reset the polarizers
-        pol_state = summary['polarizer_state']
-        pol_state = list(set(pol_state))
-        if len(pol_state) == 1:
-            if pol_state[0] == 0:
-                self.set_polarizers('linear')
-            elif pol_state[0] == 1:
-                self.set_polarizers('circular')
+        pol_state = _uniform_value(summary['polarizer_state'])
+        if pol_state == 0:
+            self.set_polarizers('linear')
+        elif pol_state == 1:
+            self.set_polarizers('circular')
 
         # reset the IF hybrids
-        if_state = summary['IF_hybrid_state']
-        if_state = list(set(if_state))
-        if len(if_state) == 1:
-            if if_state[0] == 0:
-                self.set_IF_hybrids('lu')
-            elif if_state[0] == 1:
-                self.set_IF_hybrids('iq')
+        if_state = _uniform_value(summary['IF_hybrid_state'])
+        if if_state == 0:
+            self.set_IF_hybrids('ul')
+        elif if_state == 1:
+            self.set_IF_hybrids('iq')
 
         # reset the attenuators
         attens = summary['attens']
@@ -516,10 +906,27 @@ class WBDCFrontEndServer(Pyro4Server):
         """
         report which receiver outputs feed the power meters
         """
+        if self._pm_patching_inputs is not None:
+            # the patching doesn't change while we're running
+            return self._pm_patching_inputs.copy()
         pm_inputs = self._dist_assmbly.get_signals("Power Meter")
         self.logger.debug("get_pm_patching_sources: pm_inputs: {}".format(pm_inputs))
         return pm_inputs
 
+    def invalidate_patching_cache(self):
+        """
+        Look up the power meter patching and attenuator names again.
+        Call this if the fiber optic patching has been changed while the server is running.
+        Returns:
+            None
+        """
+        self._pm_patching_inputs = None
+        self._pm_att = None
+        self._pm_patching_inputs = self.get_pm_patching_sources()
+        self.logger.debug(self._pm_patching_inputs)
+        self._pm_att = self.get_pm_atten_names(self._pm_patching_inputs)
+        self.logger.debug(self._pm_att)
+
     @auto_test()
     def get_pm_atten_names(self, pm_patching_inputs=None):
         """
@@ -529,26 +936,30 @@ class WBDCFrontEndServer(Pyro4Server):
             dict: attenuator names
         """
         if not pm_patching_inputs:
+            if self._pm_att is not None:
+                # the patching doesn't change while we're running
+                return self._pm_att.copy()
             pm_patching_inputs = self.get_pm_patching_sources()
         att = {}
         for key in pm_patching_inputs.keys():
             self.logger.debug("_attenuator_names: %s", pm_patching_inputs[key])
-            attkey = int(key[-1])
-            att[attkey] = 'R' + str(pm_patching_inputs[key]['Receiver'])
-            att[attkey] += '-' + str(pm_patching_inputs[key]['Band'])
-            att[attkey] += '-' + pm_patching_inputs[key]['Pol']
+            source = pm_patching_inputs[key]
+            att[int(key[-1])] = 'R{}-{}-{}'.format(source['Receiver'], source['Band'], source['Pol'])
         self.logger.debug("get_pm_atten_names: PM attenuator names: {}".format(att))
         return att
 
     @auto_test()
     def get_atten_names(self):
         """
-        Get the names of all the attenuators
+        Get the names of all the attenuators. The names don't change while
+        connected to a given WBDC, so they are only requested once.
         """
-        if not self._simulated:
-            return self.wbdc.get_atten_IDs()
-        else:
-            return self.simulated_atten.keys()
+        if self._atten_names_cache is None:
+            if not self._simulated:
+                self._atten_names_cache = self.wbdc.get_atten_IDs()
+            else:
+                self._atten_names_cache = list(self.simulated_atten.keys())
+        return self._atten_names_cache
 
     @auto_test(args=('R1-24-E', ))
     def get_atten(self, atten_name):
@@ -572,10 +983,7 @@ class WBDCFrontEndServer(Pyro4Server):
             dict: keys are attenuator names, values are tuple with attenuations and 'dB'
         """
         if not self._simulated:
-            report = {}
-            for name in self.get_atten_names():
-                report[name] = (self.wbdc.get_atten(name), 'dB')
-            return report
+            return {name: (self.wbdc.get_atten(name), 'dB') for name in self.get_atten_names()}
         else:
             return self.simulated_atten.copy()
 
@@ -586,14 +994,10 @@ class WBDCFrontEndServer(Pyro4Server):
         Returns:
             dict: keys are attenuator names, values are tuple with attenuations and 'dB'
         """
-        report = {}
-        for name in self._pm_att:
-            atten_name = self._pm_att[name]
-            if not self._simulated:
-                report[name] = (self.wbdc.get_atten(atten_name), self.PM_mode)
-            else:
-                report[name] = self.simulated_atten[atten_name]
-        return report
+        if not self._simulated:
+            return {name: (self.wbdc.get_atten(self._pm_att[name]), self.PM_mode) for name in self._pm_att}
+        else:
+            return {name: self.simulated_atten[self._pm_att[name]] for name in self._pm_att}
 
     @auto_test()
     def get_atten_volts(self):
@@ -602,16 +1006,12 @@ class WBDCFrontEndServer(Pyro4Server):
         Returns:
             dict: keys are attenuator names, values are voltages for each attenuator
         """
-        report = {}
-        for name in self.get_atten_names():
-            self.logger.debug("get_atten_volts: PM attenuator name: {}".format(name))
-            if not self._simulated:
-                val = self.wbdc.get_atten_volts(name)
-            else:
-                val = random.random()
-            report[name] = val
-            # self.logger.debug("get_atten_volts: {}: {}".format(name, val))
-        self.logger.debug("get_atten_volts: Volts: {}".format(report))
+        names = self.get_atten_names()
+        if not self._simulated:
+            report = {name: self.wbdc.get_atten_volts(name) for name in names}
+        else:
+            report = {name: random.random() for name in names}
+        self.logger.debug("get_atten_volts: Volts: %s", report)
         return report
 
     @auto_test()
@@ -621,20 +1021,34 @@ class WBDCFrontEndServer(Pyro4Server):
         Returns:
 
         """
-        report = {}
-        for name in self._pm_att:
-            atten_name = self._pm_att[name]
-            self.logger.debug("get_pm_atten_volts: PM attenuator key, value: {}, {}".format(name, atten_name))
+        names = list(self._pm_att.values())
+        if not self._simulated:
+            report = {name: self.wbdc.get_atten_volts(name) for name in names}
+        else:
+            report = {name: random.random() for name in names}
+        self.logger.debug("get_pm_atten_volts: Volts: %s", report)
+        return report
+
+    def _set_atten(self, atten_name, value):
+        """
+        Set an attenuator, without error handling or cache invalidation. The public
+        setters wrap this, so a call to set_pm_attens only goes through them once.
+        Args:
+            atten_name (str): The name of the attenuator (from self.get_atten_names)
+            value (float): The value we want to set
+        """
+        if value:
+            self.logger.debug("set_atten: setting %s to %.2f", atten_name, value)
             if not self._simulated:
-                val = self.wbdc.get_atten_volts(atten_name)
+                self.wbdc.set_atten(atten_name, value)
             else:
-                val = random.random()
-            report[atten_name] = val
-        self.logger.debug("get_pm_atten_volts: Volts: {}".format(report))
-        return report
+                self.simulated_atten[atten_name][0] = value
+        else:
+            self.logger.debug("set_atten: Can't set value None for attenuator {}".format(atten_name))
 
     @auto_test(args=('R1-24-E', 5.0))
     @error_decorator
+    @invalidates('minical')
     def set_atten(self, atten_name, value):
         """
 
@@ -644,18 +1058,11 @@ class WBDCFrontEndServer(Pyro4Server):
         Returns:
             None
         """
-        if value:
-            self.logger.debug("set_atten: setting {} to {:.2f}".format(atten_name, value))
-            if not self._simulated:
-                if value:
-                    self.wbdc.set_atten(atten_name, value)
-            else:
-                self.simulated_atten[atten_name][0] = value
-        else:
-            self.logger.debug("set_atten: Can't set value None for attenuator {}".format(atten_name))
+        self._set_atten(atten_name, value)
 
     @auto_test(args=(1, 5.0))
     @error_decorator
+    @invalidates('minical')
     def set_pm_atten(self, atten_id, value):
         """
         Set PIN diode attenuator for IF channel
@@ -673,11 +1080,12 @@ class WBDCFrontEndServer(Pyro4Server):
             att = atten_id
         else:
             att = self._pm_att[atten_id]
-        self.logger.debug("set_pm_atten: setting {} to {:.2f}".format(att, value))
-        self.set_atten(att, value)
+        self.logger.debug("set_pm_atten: setting %s to %.2f", att, value)
+        self._set_atten(att, value)
 
     @auto_test(args=([5.0, 5.0, 5.0, 5.0], ))
     @error_decorator
+    @invalidates('minical')
     def set_pm_attens(self, vals):
         """
         Set all the pm attenuators at once.
@@ -686,8 +1094,8 @@ class WBDCFrontEndServer(Pyro4Server):
 
         Returns:
         """
-        for i in xrange(1,5):
-            self.set_pm_atten(i, vals[i-1])
+        for i in range(1,5):
+            self._set_atten(self._pm_att[i], vals[i-1])
 
     @auto_test()
     def init_pms(self):
@@ -709,15 +1117,14 @@ class WBDCFrontEndServer(Pyro4Server):
         if not self._simulated:
             try:
                 readings = self.FE.read_pms()
-                self.logger.debug("read_pms: readings: {}".format(readings))
-            except Exception, details:
+                self.logger.debug("read_pms: readings: %s", readings)
+            except Exception as details:
                 self.logger.error("read_pms: failed due to %s", details)
-            return readings
         else:
-            readings = []
-            for i in xrange(1,5):
-                readings.append((i, datetime.datetime.utcnow().isoformat(), random.random()))
-            return readings
+            # all four readings belong to the same sample, so they share a timestamp
+            timestamp = datetime.datetime.utcnow().isoformat()
+            readings = [(i, timestamp, random.random()) for i in range(1,5)]
+        return readings
 
     @auto_test()
     def get_tsys_factors(self):
@@ -740,14 +1147,10 @@ class WBDCFrontEndServer(Pyro4Server):
             dict: with tsys and pm_readings as keys.
         """
         readings = self.read_pms()
-        tsys = []
-        pm_readings = []
-        for i in xrange(4):
-            tsysfactor = getattr(self, "tsysfactor{}".format(i+1))
-            pm_reading = readings[i][-1]
-            pm_readings.append(pm_reading)
-            tsys.append(float(pm_reading) * tsysfactor)
-        self.logger.debug('get_tsys: Current tsys values: {}'.format(tsys))
+        pm_readings = [reading[-1] for reading in readings[:4]]
+        tsys = [float(pm_reading) * tsysfactor
+                for pm_reading, tsysfactor in zip(pm_readings, self._tsysfactors)]
+        self.logger.debug("get_tsys: Current tsys values: %s", tsys)
         return {'tsys':tsys,
                 'pm_readings':pm_readings}
 
@@ -770,13 +1173,13 @@ class WBDCFrontEndServer(Pyro4Server):
         """
         if not self._simulated:
             feed_state = self._set_WBDC(12)
-            feed_state = feed_state.split("\n")
-            feed_state = [line.split(" ")[-1] for line in feed_state[1:-1]]
-            return feed_state
+            # one line per feed between the header and the trailing newline; the state is the last word
+            return [line.rpartition(" ")[2] for line in feed_state.split("\n")[1:-1]]
         else:
             return [self.simulated_feed_state[1], self.simulated_feed_state[2]]
 
     @auto_test(args=(1, 'sky'))
+    @invalidates('minical')
     def set_feed_state(self, feed, state):
         """
         Args:
@@ -791,18 +1194,9 @@ class WBDCFrontEndServer(Pyro4Server):
         else:
             if not self._simulated:
                 try:
-                    if feed == 1 and state == 'sky':
-                        self.logger.debug("Setting feed 1 to sky")
-                        return self._set_WBDC(13)
-                    elif feed == 1 and state == 'load':
-                        self.logger.debug("Setting feed 1 to load")
-                        return self._set_WBDC(14)
-                    elif feed == 2 and state == 'sky':
-                        self.logger.debug("Setting feed 2 to sky")
-                        return self._set_WBDC(15)
-                    elif feed == 2 and state == 'load':
-                        self.logger.debug("Setting feed 2 to load")
-                        return self._set_WBDC(16)
+                    opt = self._feed_state_opts[(feed, state)]
+                    self.logger.debug("Setting feed {} to {}".format(feed, state))
+                    return self._set_WBDC(opt)
                 except Exception as err:
                     error_msg = "Error setting feed state: {}".format(err)
                     self.logger.error(error_msg, exc_info=True)
@@ -825,6 +1219,7 @@ class WBDCFrontEndServer(Pyro4Server):
 
     @auto_test()
     @error_decorator
+    @ttl_cache('noise_diode_state', 1.0)
     def get_noise_diode_state(self):
         """
         Get the current state of the noise diode
@@ -842,6 +1237,7 @@ class WBDCFrontEndServer(Pyro4Server):
 
     @auto_test(args=(False, ))
     @error_decorator
+    @invalidates('noise_diode_state', 'minical')
     def set_noise_diode_state(self, state):
         """
         Set the state of the noise diode (on or off)
@@ -851,16 +1247,14 @@ class WBDCFrontEndServer(Pyro4Server):
             None
         """
         if not self._simulated:
-            if state:
-                resp = self._set_WBDC(23)
-            else:
-                resp = self._set_WBDC(24)
+            resp = self._set_WBDC(self._noise_diode_opts[bool(state)])
             self.logger.debug("set_noise_diode_state: Response from FrontEnd hardware server: {}".format(resp))
         else:
             self.simulated_noise_diode_state = state
 
     @auto_test(args=(1, True))
     @error_decorator
+    @invalidates('analog_data', 'minical')
     def set_preamp_bias(self, feed, state):
         """
         Set the pre-amp bias
@@ -870,23 +1264,15 @@ class WBDCFrontEndServer(Pyro4Server):
 
         """
         if not self._simulated:
-            if feed == 1 and state:
-                self.logger.debug("Turning feed 1 pre-amp bias on")
-                return self._set_WBDC(25)
-            elif feed == 1 and not state:
-                self.logger.debug("Turning feed 1 pre-amp bias off")
-                return self._set_WBDC(26)
-            elif feed == 2 and state:
-                self.logger.debug("Turning feed 2 pre-amp bias on")
-                return self._set_WBDC(27)
-            elif feed == 2 and not state:
-                self.logger.debug("Turning feed 2 pre-amp bias off")
-                return self._set_WBDC(28)
+            opt = self._preamp_bias_opts[(feed, bool(state))]
+            self.logger.debug("Turning feed {} pre-amp bias {}".format(feed, "on" if state else "off"))
+            return self._set_WBDC(opt)
         else:
             self.simulated_preamp_bias[feed] = state
 
     @auto_test()
     @error_decorator
+    @ttl_cache('front_end_temp', 5.0)
     def get_front_end_temp(self):
         """
         Return the front end temperature
@@ -895,17 +1281,16 @@ class WBDCFrontEndServer(Pyro4Server):
         """
         if not self._simulated:
             resp = self._set_WBDC(31)
-            return eval(resp)
+            # a hardware server that returns the dict itself needs no parsing
+            if isinstance(resp, dict):
+                return resp
+            return ast.literal_eval(resp)
         else:
-            return {
-                'load1': random.random(),
-                'load2': random.random(),
-                '12K':random.random(),
-                '70K':random.random()
-            }
+            return {key: random.random() for key in _front_end_temp_keys}
 
     @auto_test()
     @error_decorator
+    @ttl_cache('analog_data', 1.0)
     def get_analog_data(self):
         """
         Get analog data from the WBDC
@@ -916,18 +1301,11 @@ class WBDCFrontEndServer(Pyro4Server):
             resp = self._set_WBDC(38)
             return resp
         else:
-            return {'+12 V': random.random(), '+16 V': random.random(), '+16 V LDROs': random.random(),
-                    '+16 V MB': random.random(), '+16 V R1 BE': random.random(), '+16 V R1 FE': random.random(),
-                    '+16 V R2 BE': random.random(), '+16 V R2 FE': random.random(), '+6 V R1 FE': random.random(),
-                    '+6 V R2 FE': random.random(), '+6 V ana': random.random(), '+6 V analog MB': random.random(),
-                    '+6 V dig': random.random(), '+6 V digitalMB':  random.random(), '-16 V': random.random(),
-                    '-16 V MB': random.random(), '-16 V R1 BE': random.random(), '-16 V R1 FE': random.random(),
-                    '-16 V R2 BE': random.random(), '-16 V R2 FE': random.random(), 'BE plate': random.random(),
-                    'R1 E-plane': random.random(), 'R1 H-plane': random.random(), 'R1 RF plate': random.random(),
-                    'R2 E-plane': random.random(), 'R2 H-plane': random.random(), 'R2 RF plate': random.random()}
+            return {key: random.random() for key in _analog_data_keys}
 
     @auto_test()
     @error_decorator
+    @ttl_cache('crossover_switch', 1.0)
     def get_crossover_switch(self):
         """
         Get the cross over switch state in the WBDC
@@ -944,6 +1322,7 @@ class WBDCFrontEndServer(Pyro4Server):
 
     @auto_test(args=(False, ))
     @error_decorator
+    @invalidates('crossover_switch', 'minical')
     def set_crossover_switch(self, state):
         """
         Set the crossover switch in the WBDC
@@ -953,16 +1332,14 @@ class WBDCFrontEndServer(Pyro4Server):
             None
         """
         if not self._simulated:
-            if state:
-                resp = self._set_WBDC(41)
-            else:
-                resp = self._set_WBDC(42)
+            resp = self._set_WBDC(self._crossover_switch_opts[bool(state)])
             self.logger.debug("set_crossover_switch: Response from server: {}".format(resp))
         else:
             self.simulated_crossover_switch_state[1] = state
 
     @auto_test()
     @error_decorator
+    @ttl_cache('polarizers', 1.0)
     def get_polarizers(self):
         """
         Get the polorization state. 1 is circular, 0 is linear
@@ -971,25 +1348,24 @@ class WBDCFrontEndServer(Pyro4Server):
         """
         if not self._simulated:
             resp = self.wbdc.get_pol_sec_states()
-            polarizer_mode = list(set(resp))
-            if len(polarizer_mode) == 1:
-                if polarizer_mode[0] == 0:
-                    self._polarizer_mode = 'linear'
-                elif polarizer_mode[0] == 1:
-                    self._polarizer_mode = 'circular'
+            polarizer_mode = _uniform_value(resp)
+            if polarizer_mode == 0:
+                self._polarizer_mode = 'linear'
+            elif polarizer_mode == 1:
+                self._polarizer_mode = 'circular'
             return resp
         else:
             val = None
-            if self._polarizer_mode.lower().strip() == 'linear':
+            if self._polarizer_mode == 'linear':
                 val = 0
-            elif self._polarizer_mode.lower().strip() == 'circular':
+            elif self._polarizer_mode == 'circular':
                 val = 1
-            return {'R1-18': val, 'R1-20': val, 'R1-22': val, 'R1-24': val, 'R1-26': val,
-                    'R2-18': val, 'R2-20': val, 'R2-22': val, 'R2-24': val, 'R2-26': val}
+            return dict.fromkeys(_polarizer_keys, val)
 
 
     @error_decorator
     @ParserDecorator(['circular', 'linear'], [43, 44], "_polarizer_mode")
+    @invalidates('polarizers', 'analog_data', 'minical')
     def set_polarizers(self, opt):
         """
         Set the polarizers to either circular or linear
@@ -1003,15 +1379,15 @@ class WBDCFrontEndServer(Pyro4Server):
             return resp
         else:
             val = None
-            if self._polarizer_mode.lower().strip() == 'linear':
+            if self._polarizer_mode == 'linear':
                 val = 0
-            elif self._polarizer_mode.lower().strip() == 'circular':
+            elif self._polarizer_mode == 'circular':
                 val = 1
-            return {'R1-18': val, 'R1-20': val, 'R1-22': val, 'R1-24': val, 'R1-26': val,
-                    'R2-18': val, 'R2-20': val, 'R2-22': val, 'R2-24': val, 'R2-26': val}
+            return dict.fromkeys(_polarizer_keys, val)
 
     @auto_test()
     @error_decorator
+    @ttl_cache('IF_hybrids', 1.0)
     def get_IF_hybrids(self):
         """
         Get the IF hybrids state. 1 is IQ, 0 is LU
@@ -1020,27 +1396,24 @@ class WBDCFrontEndServer(Pyro4Server):
         """
         if not self._simulated:
             resp = self.wbdc.get_DC_states()
-            if_hybrid_state = list(set(resp))
-            if len(if_hybrid_state) == 1:
-                if if_hybrid_state[0] == 0:
-                    self._IF_hybrid_mode = 'lu'
-                elif if_hybrid_state[0] == 1:
-                    self._IF_hybrid_mode = 'iq'
+            if_hybrid_state = _uniform_value(resp)
+            if if_hybrid_state == 0:
+                self._IF_hybrid_mode = 'ul'
+            elif if_hybrid_state == 1:
+                self._IF_hybrid_mode = 'iq'
 
             return resp
         else:
             val = None
-            if self._IF_hybrid_mode.lower().strip() == 'iq':
+            if self._IF_hybrid_mode == 'iq':
                 val = 1
-            elif self._IF_hybrid_mode.lower().strip() == 'lu':
+            elif self._IF_hybrid_mode == 'ul':
                 val = 0
-            return {'R1-18P1': val, 'R1-18P2': val, 'R1-20P1': val, 'R1-20P2': val, 'R1-22P1': val,
-                    'R1-22P2': val, 'R1-24P1': val, 'R1-24P2': val, 'R1-26P1': val, 'R1-26P2': val,
-                    'R2-18P1': val, 'R2-18P2': val, 'R2-20P1': val, 'R2-20P2': val, 'R2-22P1': val,
-                    'R2-22P2': val, 'R2-24P1': val, 'R2-24P2': val, 'R2-26P1': val, 'R2-26P2': val}
+            return dict.fromkeys(_IF_hybrid_keys, val)
 
     @error_decorator
     @ParserDecorator(['iq', 'ul'], [45, 46], "_IF_hybrid_mode")
+    @invalidates('IF_hybrids', 'analog_data', 'minical')
     def set_IF_hybrids(self, opt):
         """
         Set the IF hybrids to IQ or LU
@@ -1054,17 +1427,15 @@ class WBDCFrontEndServer(Pyro4Server):
             return resp
         else:
             val = None
-            if self._IF_hybrid_mode.lower().strip() == 'iq':
+            if self._IF_hybrid_mode == 'iq':
                 val = 1
-            elif self._IF_hybrid_mode.lower().strip() == 'ul':
+            elif self._IF_hybrid_mode == 'ul':
                 val = 0
-            return {'R1-18P1': val, 'R1-18P2': val, 'R1-20P1': val, 'R1-20P2': val, 'R1-22P1': val,
-                    'R1-22P2': val, 'R1-24P1': val, 'R1-24P2': val, 'R1-26P1': val, 'R1-26P2': val,
-                    'R2-18P1': val, 'R2-18P2': val, 'R2-20P1': val, 'R2-20P2': val, 'R2-22P1': val,
-                    'R2-22P2': val, 'R2-24P1': val, 'R2-24P2': val, 'R2-26P1': val, 'R2-26P2': val}
+            return dict.fromkeys(_IF_hybrid_keys, val)
 
     @error_decorator
     @ParserDecorator(['w', 'db'], [[391, 392, 393, 394], [401, 402, 403, 404]], "_PM_mode")
+    @invalidates('minical')
     def set_PM_mode(self, opts):
         """
         Set the power meter mode, either W or dB.
@@ -1089,28 +1460,40 @@ class WBDCFrontEndServer(Pyro4Server):
             'return_vals' from self.perform_minical
         """
         self.logger.info("Retrieving old minical results.")
-        if not filename: filename = self.settings_file
-        try:
-            with open(filename, 'r') as f:
-                minical = json.load(f)['minical']
-                for i in xrange(4):
-                    setattr(self, "tsysfactor{}".format(i+1), minical['tsysfactors'][i])
-                return minical
-        except IOError as err:
-            self.logger.error("Couldn't find or read settings file.")
-        except ValueError as err:
+        if not filename:
+            # already read in at startup, and kept up to date since
+            settings = self._settings_json_cache
+        elif not os.path.exists(filename):
+            self.logger.error("Couldn't find settings file {}.".format(filename))
+            return None
+        else:
+            try:
+                with open(filename, 'rb') as f:
+                    settings = _json_loads(f.read())
+            except (IOError, ValueError) as err:
+                self.logger.error("Couldn't read settings file {}: {}".format(filename, err))
+                return None
+        minical = settings.get('minical') if isinstance(settings, dict) else None
+        if not isinstance(minical, dict) or len(minical.get('tsysfactors') or ()) != 4:
             self.logger.error("Couldn't find minical results in settings file.")
-        except Exception as err:
-            self.logger.error("Couldn't get previous minical results: {}".format(err), exc_info=True)
+            return None
+        self.tsysfactor1, self.tsysfactor2, self.tsysfactor3, self.tsysfactor4 = minical['tsysfactors']
+        return minical
 
-    def perform_minical(self, q=None, save_config=True):
+    def perform_minical(self, q=None, save_config=True, max_age=None):
         """
         Perform minical. This calibrates the power meters in the Front End,
         creating a correspondance between Power meter readings and sky temperature.
+        If max_age is given, the results of an earlier minical are returned
+        instead, provided they are less than max_age seconds old and nothing on
+        the RF path has been set since.
 
         args:
             q (queue.Queue.Queue): this allows us to retrive values calculated while this function runs.
                 OR, if we're using this inside a PyQt thread, this will be None
+            save_config (bool): whether to save the results to the settings file
+            max_age (float): how old (seconds) earlier results may be to be reused.
+                By default the calibration is always done.
         return (Doesn't get 'returned' -- gets 'put' in the Queue instance):
             dict containing the following keys/values:
             'tsys_pm': a list of the current power meter system temperatures
@@ -1119,9 +1502,23 @@ class WBDCFrontEndServer(Pyro4Server):
             'Tquadratic': The quadratic fit.
 
         """
+        if max_age is not None and not self._simulated:
+            with self._ttl_cache_lock:
+                entry = self._ttl_cache.get('minical')
+            if entry is not None and _monotonic() - entry[0] < max_age:
+                self.logger.info("Reusing minical results from the last {} seconds".format(max_age))
+                if not q:
+                    return entry[1]
+                else:
+                    q.put(entry[1])
+                    return
         self.logger.info("Performing minical...")
         return_vals = None
         if not self._simulated:
+            # a setter that runs during the minical makes its results stale, see ttl_cache
+            with self._ttl_cache_lock:
+                generation = self._ttl_cache_generation
+            started = _monotonic()
             try:
                 results = self._set_WBDC(29)
                 gains = results[0]
@@ -1139,26 +1536,21 @@ class WBDCFrontEndServer(Pyro4Server):
                 color1 = ['r', 'b', 'g', 'purple']
                 self.logger.info("Minical : Minical performed; Corrected PM readings-{}".format(str(x)))
                 self.logger.info("Minical : Noise diode temperatures-{}".format(str(Tnd)))
-                read_pm1, read_pm2, read_pm3, read_pm4 = x[0][0], x[1][0], x[2][0], x[3][0]
-                tsys_pm1, tsys_pm2, tsys_pm3, tsys_pm4 = Tquadratic[0][0], Tquadratic[1][0], Tquadratic[2][0], \
-                                                         Tquadratic[3][0]
-                self.logger.info(
-                    "Minical : Tsys for PM1 {}, PM2 {}, PM3 {}, PM4 {}".format(tsys_pm1, tsys_pm2, tsys_pm3, tsys_pm4))
-                self.tsysfactor1 = tsys_pm1 / read_pm1
-                self.tsysfactor2 = tsys_pm2 / read_pm2
-                self.tsysfactor3 = tsys_pm3 / read_pm3
-                self.tsysfactor4 = tsys_pm4 / read_pm4
-                self.logger.info(
-                    "Minical : Minical derived tsys factors ,{},{},{},{}".format(self.tsysfactor1, self.tsysfactor2,
-                                                                                 self.tsysfactor3, self.tsysfactor4))
+                read_pms = [row[0] for row in x[:4]]
+                tsys_pms = [row[0] for row in Tquadratic[:4]]
+                self.logger.info("Minical : Tsys for PM1-4 {}".format(tsys_pms))
+                self._tsysfactors = [tsys_pm / read_pm for tsys_pm, read_pm in zip(tsys_pms, read_pms)]
+                self.logger.info("Minical : Minical derived tsys factors {}".format(self._tsysfactors))
                 return_vals = {
-                                'tsysfactors': [self.tsysfactor1, self.tsysfactor2,
-                                                self.tsysfactor3, self.tsysfactor4],
-                                'tsys_pm': [tsys_pm1, tsys_pm2, tsys_pm4, tsys_pm4],
+                                'tsysfactors': list(self._tsysfactors),
+                                'tsys_pm': tsys_pms,
                                 'x': x,
                                 'Tlinear': Tlinear,
                                 'Tquadratic': Tquadratic
                 }
+                with self._ttl_cache_lock:
+                    if self._ttl_cache_generation == generation:
+                        self._ttl_cache['minical'] = (started, return_vals)
 
 
                     # self.logger.error("Saving minical results not yet implemented.")
@@ -1169,18 +1561,7 @@ class WBDCFrontEndServer(Pyro4Server):
 
         if save_config:
             self.logger.debug("Saving minical data to {}".format(self.settings_file))
-            with open(self.settings_file, 'r+') as f:
-                try:
-                    data = json.load(f)
-                    data.update({'minical': return_vals})
-                    f.seek(0)
-                    json.dump(data, f)
-                    f.truncate()
-                except ValueError as err:
-                    self.logger.debug("Error updating file: {}".format(err))
-                    f.seek(0)
-                    json.dump({'minical': return_vals}, f)
-                    f.truncate()
+            self._save_queue.put(('minical', return_vals))
 
 
         if not q:
@@ -2,6 +2,7 @@ from __future__ import print_function
 import logging
 import datetime
 import time
+import threading
 
 import Pyro4
 
@@ -10,6 +11,8 @@ from support.threading_util import PausableThread, iterativeRun
 
 module_logger = logging.getLogger(__name__)
 
+rms_timestamp_format = "%j-%Hh%Mm%Ss"
+
 class LongRunningWorker(PausableThread):
 
     @async.async_method
@@ -43,48 +46,51 @@ class LongRunningWorker(PausableThread):
             self.logger.error("Method {} failed with error {}".format(self.method, err))
             self.cb(None)
 
-class RMSWorker(PausableThread):
+class PollingWorker(PausableThread):
     """
-    A thread that asks for Power Meter information at a set interval
+    Base class for threads that query a server at a set interval and send the
+    results to the client with self.cb_updates.
+
+    After max_connection_closed_errors or max_communication_errors failed
+    updates, the client is assumed to be gone, and no more updates are sent.
     """
-    
-    @async.async_method
-    def __init__(self, parent, client, update_rate, logger=None, **kwargs):
-        PausableThread.__init__(self, name='RMSWorker', **kwargs)
+
+    def __init__(self, parent, update_rate, name, logger=None, **kwargs):
+        PausableThread.__init__(self, name=name, **kwargs)
         if logger:
             self.logger = logger
         else:
-            self.logger = logging.getLogger(module_logger.name + ".RMSWorker")
+            self.logger = logging.getLogger(module_logger.name + "." + name)
         self.parent = parent
-        self.spec_client = client
         self.update_rate = update_rate
         self.connection_closed_errors = 0
         self.communication_errors = 0
         self.max_connection_closed_errors = 3
         self.max_communication_errors = 3
-        self.logger.debug("self.cb: {}".format(self.cb))
-        self.logger.debug("self.cb_updates: {}".format(self.cb_updates))
+        self._muted = False
 
-    @iterativeRun
-    def run(self):
-        timestamp = datetime.datetime.utcnow()
-        rms_info = {}
-        for i in xrange(1,5):
-            rms_info[i] = self.spec_client.calc_rms(i)
-        rms_info['timestamp'] = timestamp.strftime("%j-%Hh%Mm%Ss")
+    def _send_update(self, info):
+        """
+        Send info to the client, unless it has stopped listening.
+        Args:
+            info (dict): the update
+        """
+        if self._muted:
+            return
         try:
-            self.cb_updates(rms_info)
+            self.cb_updates(info)
         except Pyro4.errors.ConnectionClosedError as err:
             self.logger.error("ConnectionClosedError: {}".format(err))
             self.connection_closed_errors += 1
         except Pyro4.errors.CommunicationError as err:
             self.logger.error("CommunicationError: {}".format(err))
             self.communication_errors += 1
-        if self.connection_closed_errors >= self.max_connection_closed_errors:
-            self.cb_updates = lambda *args, **kwargs: None
-        if self.communication_errors >= self.max_communication_errors:
-            self.cb_updates = lambda *args, **kwargs: None
-        time.sleep(self.update_rate)
+        else:
+            return
+        if (self.connection_closed_errors >= self.max_connection_closed_errors or
+                self.communication_errors >= self.max_communication_errors):
+            self.logger.error("Too many errors; no longer sending updates")
+            self._muted = True
 
     def set_callback(self, cb_info):
         pass
@@ -99,24 +105,38 @@ class RMSWorker(PausableThread):
             self.update_rate = update_rate
 
 
-class PowerMeterWorker(PausableThread):
+class RMSWorker(PollingWorker):
+    """
+    A thread that asks for Power Meter information at a set interval
+    """
+    
+    @async.async_method
+    def __init__(self, parent, client, update_rate, logger=None, **kwargs):
+        PollingWorker.__init__(self, parent, update_rate, 'RMSWorker', logger=logger, **kwargs)
+        self.spec_client = client
+        self.logger.debug("self.cb: {}".format(self.cb))
+        self.logger.debug("self.cb_updates: {}".format(self.cb_updates))
+
+    @iterativeRun
+    def run(self):
+        timestamp = time.gmtime()
+        calc_rms = self.spec_client.calc_rms
+        rms_info = {i: calc_rms(i) for i in (1, 2, 3, 4)}
+        rms_info['timestamp'] = time.strftime(rms_timestamp_format, timestamp)
+        self._send_update(rms_info)
+        time.sleep(self.update_rate)
+
+
+class PowerMeterWorker(PollingWorker):
     """
     A thread that asks for Power Meter information at a set interval
     """
     @async.async_method
     def __init__(self, parent, wbdc_client, update_rate,logger=None, **kwargs):
-        PausableThread.__init__(self, name='PowerMeterWorker', **kwargs)
-        if logger:
-            self.logger = logger
-        else:
-            self.logger = logging.getLogger(module_logger.name + ".PMWorker")
-        self.parent = parent
+        PollingWorker.__init__(self, parent, update_rate, 'PowerMeterWorker',
+                               logger=logger or logging.getLogger(module_logger.name + ".PMWorker"),
+                               **kwargs)
         self.wbdc_client = wbdc_client
-        self.update_rate = update_rate
-        self.connection_closed_errors = 0
-        self.communication_errors = 0
-        self.max_connection_closed_errors = 3
-        self.max_communication_errors = 3
         self.logger.debug("self.cb: {}".format(self.cb))
         self.logger.debug("self.cb_updates: {}".format(self.cb_updates))
 
@@ -130,35 +150,11 @@ class PowerMeterWorker(PausableThread):
                          'tsys': tsys['tsys'],
                          'pm_readings': tsys['pm_readings']}
             self.parent.tsys_info = tsys_info
-            try:
-                self.cb_updates(tsys_info)
-            except Pyro4.errors.ConnectionClosedError as err:
-                self.logger.error("ConnectionClosedError: {}".format(err))
-                self.connection_closed_errors += 1
-            except Pyro4.errors.CommunicationError as err:
-                self.logger.error("CommunicationError: {}".format(err))
-                self.communication_errors += 1
-
-        if self.connection_closed_errors >= self.max_connection_closed_errors:
-            self.cb_updates = lambda *args, **kwargs: None
-        if self.communication_errors >= self.max_communication_errors:
-            self.cb_updates = lambda *args, **kwargs: None
+            self._send_update(tsys_info)
 
         time.sleep(self.update_rate)
 
-    def set_callback(self, cb_info):
-        pass
-
-    def set_update_time(self, update_rate):
-        """
-        Change the rate at which the worker updates
-        Args:
-            update_rate (float/int): The new update rate
-        """
-        with self._lock:
-            self.update_rate = update_rate
-
-class APCWorker(PausableThread):
+class APCWorker(PollingWorker):
     """
     A thread that asks for APC information
     (offsets, current az/el, whether antenna is on source)
@@ -167,18 +163,8 @@ class APCWorker(PausableThread):
     @async.async_method
     def __init__(self, parent, apc_client, update_rate, logger=None, **kwargs):
 
-        PausableThread.__init__(self, name='APCWorker', **kwargs)
-        if logger:
-            self.logger = logger
-        else:
-            self.logger = logging.getLogger(module_logger.name + ".APCWorker")
-        self.parent = parent
+        PollingWorker.__init__(self, parent, update_rate, 'APCWorker', logger=logger, **kwargs)
         self.apc_client = apc_client
-        self.update_rate = update_rate
-        self.connection_closed_errors = 0
-        self.communication_errors = 0
-        self.max_connection_closed_errors = 3
-        self.max_communication_errors = 3
         self.logger.debug("self.cb: {}".format(self.cb))
         self.logger.debug("self.cb_updates: {}".format(self.cb_updates))
 
@@ -196,32 +182,9 @@ class APCWorker(PausableThread):
                                     'azel':azel,
                                     'onsource':onsource}
             self.parent.apc_info = apc_info
-            try:
-                self.cb_updates(apc_info)
-            except Pyro4.errors.ConnectionClosedError as err:
-                self.logger.error("ConnectionClosedError: {}".format(err))
-                self.connection_closed_errors += 1
-            except Pyro4.errors.CommunicationError as err:
-                self.logger.error("CommunicationError: {}".format(err))
-                self.communication_errors += 1
-        if self.connection_closed_errors >= self.max_connection_closed_errors:
-            self.cb_updates = lambda *args, **kwargs: None
-        if self.communication_errors >= self.max_communication_errors:
-            self.cb_updates = lambda *args, **kwargs: None
+            self._send_update(apc_info)
         time.sleep(self.update_rate)
 
-    def set_callback(self, cb_info):
-        pass
-
-    def set_update_time(self, update_rate):
-        """
-        Change the rate at which the worker updates
-        Args:
-            update_rate (float/int): The new update rate
-        """
-        with self._lock:
-            self.update_rate = update_rate
-
 class TwoBeamNodWorker(PausableThread):
 
     @async.async_method
@@ -239,6 +202,15 @@ class TwoBeamNodWorker(PausableThread):
         self.parent = parent
         self.eloffset = init_el
         self.xeloffset = init_xel
+        # set by self.stop, so the wait between scans ends right away
+        self._stop_waiting = threading.Event()
+
+    def stop(self):
+        """
+        Reimplemented from PausableThread.
+        """
+        PausableThread.stop(self)
+        self._stop_waiting.set()
 
     def run(self):
 
@@ -268,12 +240,10 @@ class TwoBeamNodWorker(PausableThread):
                     self.n_scan = 2*self.completed_cycles + i + 1
                     self.cb_updates(
                         {'status': 'Observing, on feed {}'.format(i+1), 'feed_status': i+1,'scan': self.n_scan})
-                    t_init = time.time()
-                    while time.time() - t_init < self.time_per_scan:
-                        time.sleep(0.01)
-                        if self.stopped():
-                            self._running.clear()
-                            return
+                    # wakes up as soon as the thread is stopped, or when the scan is over
+                    if self._stop_waiting.wait(self.time_per_scan):
+                        self._running.clear()
+                        return
                 self.completed_cycles += 1
 
                 # self.n_scan = -1
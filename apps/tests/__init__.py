@@ -1,4 +1,8 @@
 import logging
+import os
+
+# Debug output from the servers under test is slow and noisy, so it's opt in.
+test_log_level = logging.DEBUG if os.environ.get("TAMS_TEST_VERBOSE") else logging.WARNING
 
 def setup_logging(level):
     """
@@ -3,6 +3,7 @@ Test basic functionality of DSS43K2Client
 """
 import unittest
 import logging
+import os
 import sys
 import time
 import threading
@@ -16,34 +17,22 @@ import pyro4tunneling
 from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
 from MonitorControl.Configurations.CDSCC.apps.client.dss43k2_client import DSS43K2Client, module_logger
 
-from .. import setup_logging
+from .. import setup_logging, test_log_level
 
 
 class TestDSS43K2Client(unittest.TestCase):
 
-    isSetup = False
-
-    def setUp(self):
-        if not self.__class__.isSetup:
-            host, port = "localhost", 9090
-            server_logger = logging.getLogger("TestDSS43Server")
-            server_logger.setLevel(logging.DEBUG)
-            client_logger = logging.getLogger("TestDSS43Client")
-            client_logger.setLevel(logging.DEBUG)
-            server = DSS43K2Server(ns_port=port, ns_host=host, logger=server_logger, simulated=True)
-            server_thread = server.launch_server(ns_host=host, ns_port=port, local=True, threaded=True)
-            tunnel = pyro4tunneling.Pyro4Tunnel(ns_host=host, ns_port=port, local=True)
-            # for m in DSS43K2Client.__dict__:
-            #     m_obj = getattr(DSS43K2Client, m)
-            #     try:
-            #         exposed = m_obj._pyroExposed
-            #         client_logger.debug("{} is exposed".format(m))
-            #     except AttributeError:
-            #         pass
-            self.__class__.client = DSS43K2Client(tunnel, server.name, port=0, logger=client_logger)
-            self.__class__.isSetup = True
-        else:
-            pass
+    @classmethod
+    def setUpClass(cls):
+        host, port = "localhost", 9090
+        server_logger = logging.getLogger("TestDSS43Server")
+        server_logger.setLevel(test_log_level)
+        client_logger = logging.getLogger("TestDSS43Client")
+        client_logger.setLevel(test_log_level)
+        server = DSS43K2Server(ns_port=port, ns_host=host, logger=server_logger, simulated=True)
+        server_thread = server.launch_server(ns_host=host, ns_port=port, local=True, threaded=True)
+        tunnel = pyro4tunneling.Pyro4Tunnel(ns_host=host, ns_port=port, local=True)
+        cls.client = DSS43K2Client(tunnel, server.name, port=0, logger=client_logger)
 
     def test_get_azel(self):
         """
@@ -63,6 +52,8 @@ class TestDSS43K2Client(unittest.TestCase):
         # azel = client.get_azel()
         # logger.debug("azel: {}".format(azel))
 
+    @unittest.skipUnless(os.environ.get("RUN_BORESIGHT"),
+                         "full boresight takes minutes; set RUN_BORESIGHT to run it")
     def test_boresight(self):
 
         client = self.__class__.client
@@ -73,7 +64,7 @@ class TestDSS43K2Client(unittest.TestCase):
 if __name__ == "__main__":
 
     main_logger = logging.getLogger("TestDSS43K2Client")
-    main_logger.setLevel(logging.DEBUG)
+    main_logger.setLevel(test_log_level)
 
     suite_basic = unittest.TestSuite()
     # suite_advanced = unittest.TestSuite()
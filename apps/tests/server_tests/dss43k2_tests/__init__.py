@@ -1,48 +1,164 @@
+import atexit
 import logging
 import sys
 import time
 import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 import Pyro4
+import Pyro4.socketutil
 
 import pyro4tunneling
 
 from support.pyro import config
 
-def wait_for_callback(client, cb_name, secondary_cb=None):
-    with client.lock:
-        cb_called = client.test_status[cb_name]['status']
-    while not cb_called:
-        time.sleep(0.1)
-        with client.lock:
-            cb_called = client.test_status[cb_name]['status']
-        if secondary_cb:
-            secondary_cb()
-    with client.lock:
-        data = client.test_status[cb_name]['data']
-    return data
+from ... import test_log_level
+
+# The tests make lots of small calls over localhost, so don't let Nagle's
+# algorithm hold them back. This has to be set before any daemon or proxy
+# in the package is made. Older Pyro4 releases don't have this setting.
+if hasattr(Pyro4.config, 'SOCK_NODELAY'):
+    Pyro4.config.SOCK_NODELAY = True
+
+# put on an updates queue once the corresponding final callback has been called
+_done = object()
+
+def wait_for_callback(client, cb_name):
+    """
+    Wait until the callback cb_name has been called, and return the data it was called with.
+    """
+    client._events[cb_name].wait()
+    return client._data[cb_name]
+
+def wait_for_updates(client, cb_name, updates_check):
+    """
+    Wait until the callback cb_name has been called, handing each update that
+    comes in on cb_name + "_updates" to updates_check as soon as it arrives.
+    Args:
+        client (DSS43Client): the client that handles the callbacks
+        cb_name (str): name of the final callback
+        updates_check (callable): called with the data from each update
+    Returns:
+        the data cb_name was called with
+    """
+    updates = client._updates[cb_name + "_updates"]
+    while True:
+        data = updates.get()
+        if data is _done:
+            break
+        updates_check(data)
+    return client._data[cb_name]
+
+def submit_all(client, specs):
+    """
+    Make several asynchronous calls without waiting for their callbacks in between.
+    Args:
+        client (DSS43Client): the client whose proxy we use, and that handles the callbacks
+        specs (list): (method name, args, callback name) tuples
+    """
+    for method, args, cb_name in specs:
+        client._events[cb_name].clear()
+        client._data[cb_name] = None
+    for method, args, cb_name in specs:
+        getattr(client.proxy, method)(*args, cb_info={"cb_handler": client, "cb": cb_name})
+
+def wait_for_all(client, cb_names):
+    """
+    Wait until all the callbacks in cb_names have been called.
+    Returns:
+        dict: keys are callback names, values are the data each was called with
+    """
+    for cb_name in cb_names:
+        client._events[cb_name].wait()
+    return {cb_name: client._data[cb_name] for cb_name in cb_names}
+
+# callbacks used by the tests in this package. The shared client has all of them.
+test_cb_names = ["get_sources_cb", "get_azel_cb",
+                 "get_offsets_cb", "set_offset_el_cb",
+                 "set_offset_xel_cb", "onsource_cb",
+                 "calc_rms_cb", "set_adc_gain_cb",
+                 "calibrate_adc_all_cb", "initialize_adc_all_cb",
+                 "set_fft_shift_all_cb", "sync_start_all_cb",
+                 "boresight_cb", "boresight_cb_updates",
+                 "minical_cb", "minical_new_cb", "minical_new_cb_updates",
+                 "nodding_cb", "nodding_cb_updates",
+                 "point_onsource_cb", "point_onsource_cb_updates"]
+
+_shared = {}
+
+def get_shared_client():
+    """
+    Get the DSS43Client shared by all the tests in this package. The first call
+    starts the DSS43K2Server it talks to; later calls reuse it. The server is
+    registered on a free port without a name server, so the client connects
+    straight to its URI. (The server's own hardware connections may use a
+    name server on the default port, so we stay clear of that.)
+    The client and server are shut down when the test process exits, see
+    close_shared_client.
+    Returns:
+        DSS43Client
+    """
+    if "client" not in _shared:
+        from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
+        port = Pyro4.socketutil.findProbablyUnusedPort()
+        server_logger = logging.getLogger("TestDSS43Server")
+        server_logger.setLevel(test_log_level)
+        client_logger = logging.getLogger("TestDSS43Client")
+        server = DSS43K2Server(logger=server_logger)
+        server.launch_server(ns=False, objectPort=port, objectId=server.name,
+                             local=True, threaded=True)
+        uri = "PYRO:{}@localhost:{}".format(server.name, port)
+        DSS43Client.define_callbacks(test_cb_names)
+        DSS43Client.generate_callbacks()
+        _shared["server"] = server
+        _shared["client"] = DSS43Client(uri, logger=client_logger)
+        atexit.register(close_shared_client)
+    return _shared["client"]
+
+def close_shared_client():
+    """
+    Shut down the client and server started by get_shared_client, if any.
+    """
+    client = _shared.pop("client", None)
+    if client is not None:
+        client.close()
+    server = _shared.pop("server", None)
+    if server is not None:
+        server.close()
 
 class DSS43Client(object):
 
     cb_names = []
 
-    def __init__(self, server_name, port, logger=None):
+    def __init__(self, uri, logger=None):
         self.daemon = Pyro4.Daemon()
         self.daemon.register(self)
         self.daemon_thread = threading.Thread(target=self.daemon.requestLoop)
         self.daemon_thread.daemon = True
         self.daemon_thread.start()
 
-        ns = Pyro4.locateNS(port=port)
-        self.proxy = Pyro4.Proxy(ns.lookup(server_name))
+        self.proxy = Pyro4.Proxy(uri)
         if logger:
             self.logger = logger
         else:
             self.logger = logging.getLogger(module_logger.name + ".DSS43TestClient")
 
-        self.lock = threading.Lock()
+        # each callback stores its data, then sets its event
+        self._events = {cb_name: threading.Event() for cb_name in self.cb_names}
+        self._data = {cb_name: None for cb_name in self.cb_names}
+        self._updates = {cb_name: queue.Queue() for cb_name in self.cb_names
+                         if cb_name.endswith("_updates")}
 
-        self.test_status = {cb_name: {"status": False, "data": None} for cb_name in self.cb_names}
+    def close(self):
+        """
+        Release the proxy to the server, and stop the daemon that handles the callbacks.
+        """
+        self.proxy._pyroRelease()
+        self.daemon.shutdown()
+        self.daemon_thread.join()
 
     @classmethod
     def define_callbacks(cls, callbacks):
@@ -50,7 +166,7 @@ class DSS43Client(object):
         Define the class attribute cb_names
         """
         if not isinstance(callbacks, list):
-            callbacks = [callback]
+            callbacks = [callbacks]
         cls.cb_names = callbacks
 
     @classmethod
@@ -60,10 +176,13 @@ class DSS43Client(object):
         """
         def callback_factory(name):
             def callback(self, data=None):
-                with self.lock:
-                    self.test_status[name]['status'] = True
-                    self.test_status[name]['data'] = data
-                self.logger.debug("{}: Called.".format(name))
+                self._data[name] = data
+                self._events[name].set()
+                if name in self._updates:
+                    self._updates[name].put(data)
+                elif name + "_updates" in self._updates:
+                    self._updates[name + "_updates"].put(_done)
+                self.logger.debug("%s: Called.", name)
             return callback
 
         for cb_name in cls.cb_names:
@@ -18,29 +18,14 @@ from support.pyro import config
 from tams_source import TAMS_Source
 from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
 
-from . import DSS43Client, wait_for_callback
-from ... import setup_logging
+from . import DSS43Client, wait_for_callback, wait_for_updates, get_shared_client
+from ... import setup_logging, test_log_level
 
 
 class TestDSS43K2Boresight(unittest.TestCase):
 
-    isSetup = False
-
     def setUp(self):
-        if not self.__class__.isSetup:
-            cb_names = ["boresight_cb", "boresight_cb_updates"]
-            DSS43Client.define_callbacks(cb_names)
-            port = 50000
-            server_logger = logging.getLogger("TestDSS43Server")
-            server_logger.setLevel(logging.DEBUG)
-            client_logger = logging.getLogger("TestDSS43Client")
-            server = DSS43K2Server(logger=server_logger)
-            server_thread = server.launch_server(ns_port=port, local=True, threaded=True)
-            DSS43Client.generate_callbacks()
-            self.__class__.client = DSS43Client(server.name, port, logger=client_logger)
-            self.__class__.isSetup = True
-        else:
-            pass
+        self.__class__.client = get_shared_client()
 
     def test_pm_integrator(self):
         """
@@ -48,7 +33,7 @@ class TestDSS43K2Boresight(unittest.TestCase):
         """
         client = self.__class__.client
         pm1_mean = client.proxy.pm_integrator()
-        self.assertTrue(isinstance(pm1_mean, float))
+        self.assertIsInstance(pm1_mean, float)
 
     def test_pm_integrator_all(self):
         """
@@ -80,8 +65,8 @@ class TestDSS43K2Boresight(unittest.TestCase):
         self.client.proxy.set_boresight_running(True)
         integration = client.proxy.grab_pm_data("el", points)
         self.client.proxy.set_boresight_running(False)
-        self.assertTrue(isinstance(integration, list))
-        self.assertTrue(isinstance(integration[0], list))
+        self.assertIsInstance(integration, list)
+        self.assertIsInstance(integration[0], list)
 
     def test_boresight(self):
         """
@@ -97,14 +82,16 @@ class TestDSS43K2Boresight(unittest.TestCase):
             "cb_updates": cb_updates_name
         })
 
-        def updates_check():
+        updates = []
+        def updates_check(data):
             """
             Check to see if the updates_cb is returning the correct information
             """
-            data = wait_for_callback(client, cb_updates_name)
-            self.assertTrue(isinstance(data, dict))
+            self.assertIsInstance(data, dict)
+            updates.append(data)
 
-        result = wait_for_callback(client, cb_name, secondary_cb=updates_check)
+        result = wait_for_updates(client, cb_name, updates_check)
+        self.assertTrue(len(updates) > 0)
 
         # sanity check to see if we have all the keys we're looking for
         self.assertTrue("prog" in result)
@@ -116,12 +103,12 @@ class TestDSS43K2Boresight(unittest.TestCase):
         fields = result['fields']
 
         # type check boresight results
-        self.assertTrue(isinstance(result['prog'], list))
-        self.assertTrue(isinstance(result['fit_results'], dict))
-        self.assertTrue(isinstance(result['iter'], int))
-        self.assertTrue(isinstance(result['total_iter'], int))
-        self.assertTrue(isinstance(result['delta_offsets'], dict))
-        self.assertTrue(isinstance(result['fields'], list))
+        self.assertIsInstance(result['prog'], list)
+        self.assertIsInstance(result['fit_results'], dict)
+        self.assertIsInstance(result['iter'], int)
+        self.assertIsInstance(result['total_iter'], int)
+        self.assertIsInstance(result['delta_offsets'], dict)
+        self.assertIsInstance(result['fields'], list)
 
         # now make sure boresight results have correct data
         self.assertTrue(all(f in result['delta_offsets']['el'] for f in fields))
@@ -132,7 +119,7 @@ class TestDSS43K2Boresight(unittest.TestCase):
 if __name__ == "__main__":
 
     main_logger = logging.getLogger("TestDSS43K2Boresight")
-    main_logger.setLevel(logging.DEBUG)
+    main_logger.setLevel(test_log_level)
 
     suite_basic = unittest.TestSuite()
     suite_advanced = unittest.TestSuite()
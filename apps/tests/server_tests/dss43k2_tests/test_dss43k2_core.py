@@ -19,34 +19,13 @@ from tams_source import TAMS_Source
 from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
 
 
-from . import DSS43Client, wait_for_callback
-from ... import setup_logging
+from . import DSS43Client, wait_for_callback, get_shared_client, submit_all, wait_for_all
+from ... import setup_logging, test_log_level
 
 class TestDSS43K2Core(unittest.TestCase):
 
-    isSetup = False
-
     def setUp(self):
-        if not self.__class__.isSetup:
-            cb_names = ["get_sources_cb", "get_azel_cb",
-                        "get_offsets_cb", "set_offset_el_cb",
-                        "set_offset_xel_cb", "onsource_cb",
-                        "calc_rms_cb", "set_adc_gain_cb",
-                        "calibrate_adc_all_cb", "initialize_adc_all_cb",
-                        "set_fft_shift_all_cb", "sync_start_all_cb"]
-
-            DSS43Client.define_callbacks(cb_names)
-            port = 50000
-            server_logger = logging.getLogger("TestDSS43Server")
-            server_logger.setLevel(logging.DEBUG)
-            client_logger = logging.getLogger("TestDSS43Client")
-            server = DSS43K2Server(logger=server_logger)
-            server_thread = server.launch_server(ns_port=port, local=True, threaded=True)
-            DSS43Client.generate_callbacks()
-            self.__class__.client = DSS43Client(server.name, port, logger=client_logger)
-            self.__class__.isSetup = True
-        else:
-            pass
+        self.__class__.client = get_shared_client()
 
 
     #================== Catalog tests ==================
@@ -62,55 +41,22 @@ class TestDSS43K2Core(unittest.TestCase):
 
     # =================== APC tests ====================
 
-    def test_get_azel(self):
-        """
-        Test whether we can asynchronously get Az/El information
-        """
-        cb_name = "get_azel_cb"
-        client = self.__class__.client
-        client.proxy.get_azel(cb_info={"cb_handler":client,
-                                                          "cb": cb_name})
-        self.assertIsNotNone(wait_for_callback(client, cb_name))
-
-    def test_get_offsets(self):
+    def test_apc_pipeline(self):
         """
-        Test whether we can asynchronously get antenna offsets.
+        Test whether we can asynchronously get Az/El, offsets and antenna status,
+        and set El and Xel offsets. The calls are independent, so they're all
+        made before waiting for any of the callbacks.
         """
-        cb_name = "get_offsets_cb"
         client = self.__class__.client
-        client.proxy.get_offsets(cb_info={"cb_handler":client,
-                                                          "cb": cb_name})
-        self.assertIsNotNone(wait_for_callback(client, cb_name))
-
-    def test_onsource(self):
-        """
-        Test whether we can asynchronously get antenna status.
-        """
-        cb_name = "onsource_cb"
-        client = self.__class__.client
-        client.proxy.onsource(cb_info={"cb_handler":client,
-                                                          "cb": cb_name})
-        self.assertIsNotNone(wait_for_callback(client, cb_name))
-
-    def test_set_offset_el(self):
-        """
-        Test whether we can asynchronously set El offset.
-        """
-        cb_name = "set_offset_el_cb"
-        client = self.__class__.client
-        client.proxy.set_offset_el(0.0, cb_info={"cb_handler":client,
-                                                          "cb": cb_name})
-        self.assertIsNotNone(wait_for_callback(client, cb_name))
-
-    def test_set_offset_xel(self):
-        """
-        Test whether we can asynchronously set Xel offset.
-        """
-        cb_name = "set_offset_xel_cb"
-        client = self.__class__.client
-        client.proxy.set_offset_xel(0.0, cb_info={"cb_handler":client,
-                                                          "cb": cb_name})
-        self.assertIsNotNone(wait_for_callback(client, cb_name))
+        specs = [("get_azel", (), "get_azel_cb"),
+                 ("get_offsets", (), "get_offsets_cb"),
+                 ("onsource", (), "onsource_cb"),
+                 ("set_offset_el", (0.0, ), "set_offset_el_cb"),
+                 ("set_offset_xel", (0.0, ), "set_offset_xel_cb")]
+        submit_all(client, specs)
+        results = wait_for_all(client, [cb_name for method, args, cb_name in specs])
+        for cb_name in results:
+            self.assertIsNotNone(results[cb_name], cb_name)
 
     # =================== Spectrometer Tests ======================
     def test_calc_rms(self):
@@ -176,18 +122,14 @@ class TestDSS43K2Core(unittest.TestCase):
 
 if __name__ == '__main__':
     main_logger = logging.getLogger("TestDSS43K2Core")
-    main_logger.setLevel(logging.DEBUG)
+    main_logger.setLevel(test_log_level)
 
     suite_basic = unittest.TestSuite()
     suite_advanced = unittest.TestSuite()
 
     suite_basic.addTest(TestDSS43K2Core("test_get_sources"))
 
-    suite_basic.addTest(TestDSS43K2Core("test_get_azel"))
-    suite_basic.addTest(TestDSS43K2Core("test_get_offsets"))
-    suite_basic.addTest(TestDSS43K2Core("test_onsource"))
-    suite_basic.addTest(TestDSS43K2Core("test_set_offset_el"))
-    suite_basic.addTest(TestDSS43K2Core("test_set_offset_xel"))
+    suite_basic.addTest(TestDSS43K2Core("test_apc_pipeline"))
 
     # suite_basic.addTest(TestDSS43K2Core("test_calc_rms"))
     # suite_basic.addTest(TestDSS43K2Core("test_set_adc_gain"))
@@ -4,6 +4,7 @@ import sys
 import time
 import threading
 
+import numpy as np
 import Pyro4
 import Pyro4.naming
 import Pyro4.socketutil
@@ -17,29 +18,13 @@ from tams_source import TAMS_Source
 from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
 import MonitorControl.FrontEnds.minical.process_minical as process_minical
 
-from . import DSS43Client, wait_for_callback
-from ... import setup_logging
+from . import DSS43Client, wait_for_callback, wait_for_updates, get_shared_client
+from ... import setup_logging, test_log_level
 
 class TestDSS43K2Minical(unittest.TestCase):
 
-    isSetup = False
-
     def setUp(self):
-        if not self.__class__.isSetup:
-            cb_names = ["minical_cb",
-                        "minical_new_cb", "minical_new_cb_updates"]
-            DSS43Client.define_callbacks(cb_names)
-            port = 50000
-            server_logger = logging.getLogger("TestDSS43Server")
-            server_logger.setLevel(logging.DEBUG)
-            client_logger = logging.getLogger("TestDSS43Client")
-            server = DSS43K2Server(logger=server_logger)
-            server_thread = server.launch_server(ns_port=port, local=True, threaded=True)
-            DSS43Client.generate_callbacks()
-            self.__class__.client = DSS43Client(server.name, port, logger=client_logger)
-            self.__class__.isSetup = True
-        else:
-            pass
+        self.__class__.client = get_shared_client()
 
     def test_minical(self):
         cb_name = "minical_cb"
@@ -70,7 +55,7 @@ class TestDSS43K2Minical(unittest.TestCase):
 
         result = client.proxy.process_minical_calib(calib)
         result1 = []
-        for i in xrange(4):
+        for i in range(4):
             calib_i = {key: calib[key][i] for key in calib if key != "mode"}
             calib_i['mode'] = "W"
             result1.append(process_minical(calib_i))
@@ -78,36 +63,14 @@ class TestDSS43K2Minical(unittest.TestCase):
         logger.debug("result: {}".format(result))
         logger.debug("result1: {}".format(result1))
 
-        for i in xrange(4):
-            gains = [j[i] for j in result['gains']]
-            gains1 = result1[i][0]
-            logger.debug("gains: {}".format(gains))
-            logger.debug("gains1: {}".format(gains1))
-            self.assertTrue(all(i == j for i,j in zip(gains, gains1)))
-
-            linear = [j[i] for j in result['linear']]
-            linear1 = result1[i][1]
-            logger.debug("linear: {}".format(linear))
-            logger.debug("linear1: {}".format(linear1))
-            self.assertTrue(all(i == j for i,j in zip(linear, linear1)))
-
-            quadratic = [j[i] for j in result['quadratic']]
-            quadratic1 = result1[i][2]
-            logger.debug("quadratic: {}".format(quadratic))
-            logger.debug("quadratic1: {}".format(quadratic1))
-            self.assertTrue(all(i == j for i,j in zip(quadratic, quadratic1)))
-
-            Tnd = result['nd-temp'][i]
-            Tnd1 = result1[i][3]
-            logger.debug("Tnd: {}".format(Tnd))
-            logger.debug("Tnd1: {}".format(Tnd1))
-            self.assertTrue(Tnd == Tnd1)
-
-            nonlin = result['non-linearity'][i]
-            nonlin1 = result1[i][4]
-            logger.debug("nonlin: {}".format(nonlin))
-            logger.debug("nonlin1: {}".format(nonlin1))
-            self.assertTrue(nonlin == nonlin1)
+        # result has one row per parameter and one column per channel;
+        # result1 has one entry per channel.
+        for key, idx in (('gains', 0), ('linear', 1), ('quadratic', 2)):
+            np.testing.assert_array_equal(np.array(result[key]).T,
+                                          np.array([r[idx] for r in result1]),
+                                          err_msg=key)
+        np.testing.assert_array_equal(result['nd-temp'], [r[3] for r in result1])
+        np.testing.assert_array_equal(result['non-linearity'], [r[4] for r in result1])
 
 
     def test_minical_new(self):
@@ -120,20 +83,22 @@ class TestDSS43K2Minical(unittest.TestCase):
             "cb_updates": cb_updates_name
         })
 
-        def updates_check():
+        updates = []
+        def updates_check(data):
             """
             Check to see if the updates_cb is returning the correct information
             """
-            data = wait_for_callback(client, cb_updates_name)
-            self.assertTrue(isinstance(data, dict))
+            self.assertIsInstance(data, dict)
+            updates.append(data)
 
-        result = wait_for_callback(client, cb_name, secondary_cb=updates_check)
+        result = wait_for_updates(client, cb_name, updates_check)
+        self.assertTrue(len(updates) > 0)
         self.assertIsNotNone(result)
 
 if __name__ == "__main__":
 
     main_logger = logging.getLogger("TestDSS43K2Minical")
-    main_logger.setLevel(logging.DEBUG)
+    main_logger.setLevel(test_log_level)
 
     suite_basic = unittest.TestSuite()
     suite_advanced = unittest.TestSuite()
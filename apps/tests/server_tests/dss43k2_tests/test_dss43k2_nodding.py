@@ -14,34 +14,13 @@ from support.pyro import config
 from tams_source import TAMS_Source
 from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
 
-from . import DSS43Client, wait_for_callback
-from ... import setup_logging
+from . import DSS43Client, wait_for_callback, get_shared_client
+from ... import setup_logging, test_log_level
 
 class TestDSS43K2Nodding(unittest.TestCase):
 
-    isSetup = False
-
-    def setUp(self):
-        if not self.__class__.isSetup:
-            cb_names = ["nodding_cb", "nodding_cb_updates"]
-            DSS43Client.define_callbacks(cb_names)
-            port = 50000
-            server_logger = logging.getLogger("TestDSS43Server")
-            server_logger.setLevel(logging.DEBUG)
-            client_logger = logging.getLogger("TestDSS43Client")
-            server = DSS43K2Server(logger=server_logger)
-            server_thread = server.launch_server(ns_port=port, local=True, threaded=True)
-            DSS43Client.generate_callbacks()
-            self.__class__.client = DSS43Client(server.name, port, logger=client_logger)
-            self.__class__.isSetup = True
-        else:
-            pass
-
-    def test_nodding(self):
-
-        nodding_cb_updates_name = "nodding_cb_updates"
-        nodding_cb_name = "nodding_cb"
-
+    @classmethod
+    def setUpClass(cls):
         test_src_dict = {
             "status": None,
             "category": "known maser",
@@ -64,10 +43,20 @@ class TestDSS43K2Nodding(unittest.TestCase):
                       category=test_src_dict["category"],
                       obs_data=test_src_dict.get('obs_data', None),
                       status=test_src_dict.get('status', None))
+        # serialized once, and reused by every nodding test
+        cls.test_src_payload = test_src.toDict()
+
+    def setUp(self):
+        self.__class__.client = get_shared_client()
+
+    def test_nodding(self):
+
+        nodding_cb_updates_name = "nodding_cb_updates"
+        nodding_cb_name = "nodding_cb"
 
         client = self.__class__.client
         client.proxy.record_data(n_cycles=1, time_per_scan=10,
-            src_obj=test_src.toDict(),cb_info={
+            src_obj=self.test_src_payload,cb_info={
             'cb_handler':client,
             'cb':nodding_cb_name,
             'cb_updates':nodding_cb_updates_name
@@ -76,7 +65,7 @@ class TestDSS43K2Nodding(unittest.TestCase):
 
 if __name__ == "__main__":
     main_logger = logging.getLogger("TestDSS43K2Nodding")
-    main_logger.setLevel(logging.DEBUG)
+    main_logger.setLevel(test_log_level)
     suite = unittest.TestSuite()
     suite.addTest(TestDSS43K2Nodding("test_nodding"))
     unittest.TextTestRunner().run(suite)
@@ -18,29 +18,23 @@ from support.pyro import config
 from tams_source import TAMS_Source
 from MonitorControl.Configurations.CDSCC.apps.server.dss43k2_server import DSS43K2Server
 
-from . import DSS43Client, wait_for_callback
-from ... import setup_logging
+from . import DSS43Client, wait_for_callback, wait_for_updates, get_shared_client
+from ... import setup_logging, test_log_level
 
 
 class TestDSS43K2PointOnSource(unittest.TestCase):
 
-    isSetup = False
+    @classmethod
+    def setUpClass(cls):
+        # serialized once, and reused by every pointing test
+        cls.test_src_payload = TAMS_Source(
+            name="0537-441",
+            ra=1.478465645926414,
+            dec=-0.7694426542639248
+        ).toDict()
 
     def setUp(self):
-        if not self.__class__.isSetup:
-            cb_names = ["point_onsource_cb", "point_onsource_cb_updates"]
-            DSS43Client.define_callbacks(cb_names)
-            port = 50000
-            server_logger = logging.getLogger("TestDSS43Server")
-            server_logger.setLevel(logging.DEBUG)
-            client_logger = logging.getLogger("TestDSS43Client")
-            server = DSS43K2Server(logger=server_logger)
-            server_thread = server.launch_server(ns_port=port, local=True, threaded=True)
-            DSS43Client.generate_callbacks()
-            self.__class__.client = DSS43Client(server.name, port, logger=client_logger)
-            self.__class__.isSetup = True
-        else:
-            pass
+        self.__class__.client = get_shared_client()
 
     def test_point_onsource(self):
         """
@@ -50,32 +44,28 @@ class TestDSS43K2PointOnSource(unittest.TestCase):
         cb_updates_name = "point_onsource_cb_updates"
         client = self.__class__.client
 
-        test_src = TAMS_Source(
-            name="0537-441",
-            ra=1.478465645926414,
-            dec=-0.7694426542639248
-        )
-
-        client.proxy.point_onsource(test_src.toDict(), cb_info={
+        client.proxy.point_onsource(self.test_src_payload, cb_info={
             "cb_handler":client,
             "cb":cb_name,
             "cb_updates": cb_updates_name
         })
 
-        def updates_check():
+        updates = []
+        def updates_check(data):
             """
             Check to see if the updates_cb is returning the correct information
             """
-            data = wait_for_callback(client, cb_updates_name)
-            self.assertTrue(isinstance(data, dict))
+            self.assertIsInstance(data, dict)
+            updates.append(data)
 
-        result = wait_for_callback(client, cb_name, secondary_cb=updates_check)
-        self.assertTrue(isinstance(result, dict))
+        result = wait_for_updates(client, cb_name, updates_check)
+        self.assertTrue(len(updates) > 0)
+        self.assertIsInstance(result, dict)
 
 if __name__ == "__main__":
 
     main_logger = logging.getLogger("TestDSS43K2PointOnSource")
-    main_logger.setLevel(logging.DEBUG)
+    main_logger.setLevel(test_log_level)
 
     suite_basic = unittest.TestSuite()
     suite_basic.addTest(TestDSS43K2PointOnSource("test_point_onsource"))
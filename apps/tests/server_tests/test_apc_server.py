@@ -5,17 +5,8 @@ from TAMS_BackEnd.servers import APCServer
 
 class TestAPC(unittest.TestCase):
 
-    isSetup = False
     server = APCServer()
 
-    def setUp(self):
-
-        if not self.isSetup:
-            self.__class__.isSetup = True
-            # self.__class__.server = APCServer(simulated=True)
-        else:
-            pass
-
 if __name__ == '__main__':
 
     runner = unittest.TextTestRunner()
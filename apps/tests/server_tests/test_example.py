@@ -5,15 +5,9 @@ from TAMS_BackEnd.examples.basic_pyro4_server import BasicServer
 
 class TestExample(unittest.TestCase):
 
-    isSetup = False
-
-    def setUp(self):
-
-        if not self.isSetup:
-            self.__class__.isSetup = True
-            self.__class__.server = BasicServer()
-        else:
-            pass
+    @classmethod
+    def setUpClass(cls):
+        cls.server = BasicServer()
 
 if __name__ == '__main__':
 
@@ -7,20 +7,12 @@ from MonitorControl.BackEnds.ROACH1.apps.server.SAO_pyro4_server import Spectrom
 
 class TestSpectrometer(unittest.TestCase):
 
-    isSetup = False
-
-    # server = WBDCFrontEndServer(simulated=True, loglevel=logging.DEBUG)
-
-    def setUp(self):
-
-        if not self.isSetup:
-            self.__class__.isSetup = True
-            self.__class__.server = SpectrometerServer("Spec",
-                                                       simulated=True,
-                                                       loglevel=logging.DEBUG,
-                                                       logfile="./WBDCtest.log")
-        else:
-            pass
+    @classmethod
+    def setUpClass(cls):
+        cls.server = SpectrometerServer("Spec",
+                                        simulated=True,
+                                        loglevel=logging.DEBUG,
+                                        logfile="./WBDCtest.log")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,325 @@
+import unittest
+import logging
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from MonitorControl.Configurations.CDSCC.apps.server.wbdc_server import (
+    WBDCFrontEndServer, ttl_cache, invalidates, _uniform_value, _analog_data_keys)
+
+from .. import test_log_level
+
+
+class CacheOwner(object):
+    """
+    The attributes ttl_cache and invalidates expect, without a server.
+    """
+    def __init__(self):
+        self._ttl_cache = {}
+        self._ttl_cache_lock = threading.RLock()
+        self._ttl_cache_generation = 0
+        self.state = 0
+        self.n_reads = 0
+        self.during_read = None
+
+    def _invalidate_cache(self, *keys):
+        with self._ttl_cache_lock:
+            self._ttl_cache_generation += 1
+            for key in keys:
+                self._ttl_cache.pop(key, None)
+
+    @ttl_cache('state', 60.0)
+    def get_state(self):
+        self.n_reads += 1
+        state = self.state
+        if self.during_read:
+            self.during_read()
+        return state
+
+    @ttl_cache('state_expired', -1.0)
+    def get_state_expired(self):
+        self.n_reads += 1
+        return self.state
+
+    @invalidates('state')
+    def set_state(self, state):
+        self.state = state
+
+    @invalidates('state')
+    def set_state_fails(self, state):
+        raise RuntimeError("Oops")
+
+
+class TestUniformValue(unittest.TestCase):
+
+    def test_dict(self):
+        self.assertEqual(_uniform_value({'R1-18': 1, 'R2-18': 1}), 1)
+        self.assertIsNone(_uniform_value({'R1-18': 1, 'R2-18': 0}))
+
+    def test_list(self):
+        self.assertEqual(_uniform_value([0, 0, 0]), 0)
+        self.assertIsNone(_uniform_value([0, 1, 0]))
+
+    def test_empty(self):
+        self.assertIsNone(_uniform_value({}))
+        self.assertIsNone(_uniform_value([]))
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def setUp(self):
+        self.owner = CacheOwner()
+
+    def test_cached(self):
+        self.assertEqual(self.owner.get_state(), 0)
+        self.owner.state = 1
+        self.assertEqual(self.owner.get_state(), 0)
+        self.assertEqual(self.owner.n_reads, 1)
+
+    def test_expired(self):
+        self.owner.get_state_expired()
+        self.owner.state = 1
+        self.assertEqual(self.owner.get_state_expired(), 1)
+        self.assertEqual(self.owner.n_reads, 2)
+
+    def test_invalidated_by_setter(self):
+        self.owner.get_state()
+        self.owner.set_state(1)
+        self.assertEqual(self.owner.get_state(), 1)
+
+    def test_invalidated_after_failed_setter(self):
+        self.owner.get_state()
+        self.assertRaises(RuntimeError, self.owner.set_state_fails, 1)
+        self.assertNotIn('state', self.owner._ttl_cache)
+
+    def test_not_cached_if_set_during_read(self):
+        # the getter reads the old state, then the setter runs before it returns
+        def set_during_read():
+            self.owner.during_read = None
+            self.owner.set_state(1)
+        self.owner.during_read = set_during_read
+        self.assertEqual(self.owner.get_state(), 0)
+        self.assertEqual(self.owner.get_state(), 1)
+
+
+class TestWBDCFrontEndServerCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        server_logger = logging.getLogger(__name__ + ".WBDCFrontEndServer")
+        server_logger.setLevel(test_log_level)
+        cls.server = WBDCFrontEndServer(
+            simulated=True,
+            settings_file=os.path.join(cls.tmp_dir, "WBDCFrontEndsettings.json"),
+            logger=server_logger)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+        shutil.rmtree(cls.tmp_dir)
+
+    def test_noise_diode_state(self):
+        for state in (True, False):
+            self.server.get_noise_diode_state()
+            self.server.set_noise_diode_state(state)
+            self.assertEqual(self.server.get_noise_diode_state(), state)
+
+    def test_crossover_switch(self):
+        for state in (True, False):
+            self.server.get_crossover_switch()
+            self.server.set_crossover_switch(state)
+            self.assertEqual(self.server.get_crossover_switch()[1], state)
+
+    def test_polarizers(self):
+        for mode, val in (('linear', 0), ('circular', 1)):
+            self.server.get_polarizers()
+            self.server.set_polarizers(mode)
+            self.assertEqual(_uniform_value(self.server.get_polarizers()), val)
+
+    def test_IF_hybrids(self):
+        for mode, val in (('ul', 0), ('iq', 1)):
+            self.server.get_IF_hybrids()
+            self.server.set_IF_hybrids(mode)
+            self.assertEqual(_uniform_value(self.server.get_IF_hybrids()), val)
+            self.assertEqual(self.server.IF_hybrid_mode, mode)
+
+    def test_setters_drop_minical(self):
+        setters = [(self.server.set_atten, ('R1-24-E', 5.0)),
+                   (self.server.set_pm_attens, ([5.0, 5.0, 5.0, 5.0], )),
+                   (self.server.set_PM_mode, ('W', )),
+                   (self.server.set_polarizers, ('circular', )),
+                   (self.server.set_IF_hybrids, ('iq', )),
+                   (self.server.set_crossover_switch, (False, )),
+                   (self.server.set_feed_state, (1, 'sky')),
+                   (self.server.set_noise_diode_state, (False, )),
+                   (self.server.set_preamp_bias, (1, True))]
+        for setter, args in setters:
+            self.server._ttl_cache['minical'] = (0.0, {})
+            setter(*args)
+            self.assertNotIn('minical', self.server._ttl_cache, msg=setter.__name__)
+
+
+class FakeFE(object):
+    """
+    Stands in for the FE hardware server.
+    """
+    # gains, Tlinear, Tquadratic, Tnd, NonLin, x, as set_WBDC(29) returns them
+    minical_results = ([1.0] * 4, [[100.0]] * 4, [[100.0]] * 4, [10.0] * 4, [0.0] * 4, [[2.0]] * 4)
+
+    def __init__(self):
+        self.n_minicals = 0
+        self.during_minical = None
+
+    def set_WBDC(self, opt):
+        if opt != 29:
+            return "ok"
+        self.n_minicals += 1
+        if self.during_minical:
+            self.during_minical()
+        return self.minical_results
+
+
+class CallbackHandler(object):
+    """
+    Receives the callback of an async server method.
+    """
+    def __init__(self):
+        self.called = threading.Event()
+        self.data = None
+
+    def state_cb(self, data=None):
+        self.data = data
+        self.called.set()
+
+
+class SimulatedServerTestCase(unittest.TestCase):
+    """
+    Each test gets its own simulated server and settings file.
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.settings_file = os.path.join(self.tmp_dir, "WBDCFrontEndsettings.json")
+        server_logger = logging.getLogger(__name__ + ".WBDCFrontEndServer")
+        server_logger.setLevel(test_log_level)
+        self.server = WBDCFrontEndServer(simulated=True,
+                                         settings_file=self.settings_file,
+                                         logger=server_logger)
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def read_settings(self):
+        with open(self.settings_file) as f:
+            return json.load(f)
+
+
+class TestWBDCFrontEndServerSettings(SimulatedServerTestCase):
+
+    def test_changed_atten_saved(self):
+        self.server.get_WBDCFrontEnd_state()
+        self.server.set_atten('R1-18-E', 3.0)
+        self.server.get_WBDCFrontEnd_state()
+        self.server._save_queue.join()
+        self.assertEqual(self.read_settings()['settings']['attens']['R1-18-E'][0], 3.0)
+
+    def test_queued_save_written_on_close(self):
+        minical = {'tsysfactors': [2.0, 2.0, 2.0, 2.0]}
+        self.server._save_queue.put(('minical', minical))
+        self.server.close()
+        self.server = None
+        self.assertEqual(self.read_settings()['minical'], minical)
+
+
+class TestPerformMinical(SimulatedServerTestCase):
+    """
+    The simulator doesn't do minicals, so the FE hardware server is faked.
+    """
+    def setUp(self):
+        SimulatedServerTestCase.setUp(self)
+        self.fe = FakeFE()
+        self.server.FE = self.fe
+        self.server._simulated = False
+
+    def tearDown(self):
+        self.server._simulated = True
+        SimulatedServerTestCase.tearDown(self)
+
+    def test_recalibrates_by_default(self):
+        self.server.perform_minical(save_config=False)
+        self.server.perform_minical(save_config=False)
+        self.assertEqual(self.fe.n_minicals, 2)
+
+    def test_max_age_reuses_results(self):
+        results = self.server.perform_minical(save_config=False)
+        self.assertEqual(results['tsysfactors'], [50.0] * 4)
+        self.assertEqual(self.server.perform_minical(save_config=False, max_age=60.0), results)
+        self.assertEqual(self.fe.n_minicals, 1)
+
+    def test_max_age_exceeded(self):
+        self.server.perform_minical(save_config=False)
+        self.server.perform_minical(save_config=False, max_age=0.0)
+        self.assertEqual(self.fe.n_minicals, 2)
+
+    def test_setter_drops_results(self):
+        self.server.perform_minical(save_config=False)
+        self.server.set_noise_diode_state(True)
+        self.server.perform_minical(save_config=False, max_age=60.0)
+        self.assertEqual(self.fe.n_minicals, 2)
+
+    def test_setter_during_minical_drops_results(self):
+        def set_during_minical():
+            self.fe.during_minical = None
+            self.server.set_noise_diode_state(True)
+        self.fe.during_minical = set_during_minical
+        self.server.perform_minical(save_config=False)
+        self.server.perform_minical(save_config=False, max_age=60.0)
+        self.assertEqual(self.fe.n_minicals, 2)
+
+
+class TestStatusBundle(SimulatedServerTestCase):
+
+    def test_status_bundle(self):
+        bundle = self.server.get_status_bundle()
+        self.assertEqual(sorted(bundle), sorted(['analog_data', 'front_end_temp', 'noise_diode_state',
+                                                 'crossover_switch', 'polarizers', 'IF_hybrids']))
+        self.assertNotIn(None, bundle.values())
+        self.assertEqual(sorted(bundle['analog_data']), sorted(_analog_data_keys))
+        self.assertEqual(bundle['noise_diode_state'], self.server.get_noise_diode_state())
+        self.assertEqual(bundle['crossover_switch'], self.server.get_crossover_switch())
+        self.assertEqual(bundle['polarizers'], self.server.get_polarizers())
+        self.assertEqual(bundle['IF_hybrids'], self.server.get_IF_hybrids())
+
+
+class TestWBDCFrontEndStateAsync(SimulatedServerTestCase):
+
+    def test_delivered_through_callback(self):
+        handler = CallbackHandler()
+        self.server.get_WBDCFrontEnd_state_async(save_config=False,
+                                                 cb_info={"cb_handler": handler, "cb": "state_cb"})
+        handler.called.wait()
+        self.assertEqual(sorted(handler.data), ['report', 'report_dict'])
+        report_dict = handler.data['report_dict']
+        self.assertEqual(report_dict['attens'], self.server.get_attens())
+        self.assertEqual(report_dict['noise_diode_state'], self.server.get_noise_diode_state())
+
+
+class TestPatchingCache(SimulatedServerTestCase):
+
+    def test_invalidate_patching_cache(self):
+        expected = self.server.get_pm_patching_sources()
+        # stand-in for patching that has changed since it was looked up
+        self.server._pm_patching_inputs = {}
+        self.server._pm_att = {}
+        self.assertEqual(self.server.get_pm_patching_sources(), {})
+        self.server.invalidate_patching_cache()
+        self.assertEqual(self.server.get_pm_patching_sources(), expected)
+        self.assertEqual(self.server.pm_att, self.server.get_pm_atten_names(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,18 +6,11 @@ from TAMS_BackEnd.servers import WBDCFrontEndServer
 
 class TestWBDCFrontEnd(unittest.TestCase):
 
-    isSetup = False
-    # server = WBDCFrontEndServer(simulated=True, loglevel=logging.DEBUG)
-
-    def setUp(self):
-
-        if not self.isSetup:
-            self.__class__.isSetup = True
-            self.__class__.server = WBDCFrontEndServer(simulated=False,
-                                                       loglevel=logging.DEBUG,
-                                                       logfile="./WBDCtest.log")
-        else:
-            pass
+    @classmethod
+    def setUpClass(cls):
+        cls.server = WBDCFrontEndServer(simulated=False,
+                                        loglevel=logging.DEBUG,
+                                        logfile="./WBDCtest.log")
 
 if __name__ == '__main__':
 
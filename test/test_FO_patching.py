@@ -7,8 +7,19 @@ from MonitorControl.Configurations.CDSCC.FO_patching import DistributionAssembly
 
 test_dir = os.path.dirname(os.path.abspath(__file__)) + "/"
 
+test_file_name = "test_FO_patching.xlsx"
+
 class TestFO_Patching(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # parsing the spreadsheet is the slow part, so only do it once.
+        # DistributionAssembly only reads the workbook, so the tests can share it.
+        cls.da = DistributionAssembly(parampath=test_dir, paramfile=test_file_name)
+        test_patching_json_path = os.path.join(test_dir, "test_patching.json")
+        with open(test_patching_json_path, "r") as f:
+            cls.test_patching = json.load(f)
+
     def test_init_default_args(self):
 
         da = DistributionAssembly()
@@ -17,8 +28,7 @@ class TestFO_Patching(unittest.TestCase):
 
     def test_init_custom_args(self):
 
-        test_file_name = "test_FO_patching.xlsx"
-        da = DistributionAssembly(parampath=test_dir,paramfile=test_file_name)
+        da = self.da
         self.assertTrue(da.parampath == test_dir)
         self.assertTrue(da.paramfile == test_file_name)
 
@@ -26,15 +36,11 @@ class TestFO_Patching(unittest.TestCase):
         """
         test whether get_patching returns expected results
         """
-        test_patching_json_path = os.path.join(test_dir, "test_patching.json")
-        with open(test_patching_json_path, "r") as f:
-            test_patching = json.load(f)
-
-        test_file_name = "test_FO_patching.xlsx"
-        da = DistributionAssembly(parampath=test_dir,paramfile=test_file_name)
-        patching = da.get_patching()
-        for key in patching:
-            self.assertDictEqual(patching[key], test_patching[str(key)])
+        patching = self.da.get_patching()
+        # check all the IFs, so a failure reports every one that doesn't match
+        mismatches = {key: (patching[key], self.test_patching[str(key)])
+                      for key in patching if patching[key] != self.test_patching[str(key)]}
+        self.assertEqual(mismatches, {})
 
 
 
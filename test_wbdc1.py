@@ -1,3 +1,5 @@
+import logging
+
 from MonitorControl.Configurations.configCDSCC.K_4ch import \
   observatory as obs, \
   telescope as tel, \
@@ -7,7 +9,10 @@ from MonitorControl.Configurations.configCDSCC.K_4ch import \
 from MonitorControl.SDFITS import FITSfile
 #from MonitorControl.config_test import *
 
-import pyfits
+try:
+  import astropy.io.fits as pyfits
+except ImportError:
+  import pyfits
 
 if __name__ == "__main__":
   logging.basicConfig(level=logging.DEBUG)